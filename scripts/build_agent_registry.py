@@ -0,0 +1,43 @@
+"""
+Generate ``src/agents/_registry.py``, the static agent name -> module table.
+
+The agents package consults this table to import only the module that defines a
+requested agent instead of scanning every module. Re-run after adding, renaming, or
+moving agents:
+
+    python scripts/build_agent_registry.py
+"""
+
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+import agents  # noqa: E402
+
+HEADER = '''"""Generated by scripts/build_agent_registry.py -- do not edit by hand."""
+
+'''
+
+
+def main() -> int:
+    prefix = f"{agents.package_name}."
+    modules = [m[len(prefix):] for m in agents._agent_module_names()]
+    index: dict[str, str] = {}
+    for rel in modules:
+        for name in agents._scan_classes(prefix + rel):
+            index[name] = rel
+    lines = ["AGENT_MODULES = ("]
+    lines += [f'    "{rel}",' for rel in modules]
+    lines += [")", "", "AGENT_INDEX = {"]
+    lines += [f'    "{name}": "{rel}",' for name, rel in sorted(index.items())]
+    lines += ["}", ""]
+    out = SRC / "agents" / "_registry.py"
+    out.write_text(HEADER + "\n".join(lines), encoding="utf-8")
+    print(f"Wrote {len(index)} agent(s) from {len(modules)} module(s) to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
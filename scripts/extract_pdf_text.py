@@ -1,28 +1,147 @@
-import sys
+import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
 from pathlib import Path
-from pypdf import PdfReader
+from typing import BinaryIO, Iterator, Optional
+
+from pypdf import PageObject, PdfReader
+
+# Backend name -> importable module providing it
+BACKENDS = {"pypdf": "pypdf", "pypdfium2": "pypdfium2", "pymupdf": "fitz"}
+
+# Per-worker reader, opened once by the pool initializer
+_READER: Optional[PdfReader] = None
+
+
+def _open_reader(handle: BinaryIO) -> PdfReader:
+    """Build a reader over an open file handle so pypdf reads objects on demand.
+
+    Given a path, pypdf loads the whole file into memory; with a handle it seeks
+    lazily, which keeps each worker's footprint small for very large PDFs.
+    """
+    return PdfReader(handle, strict=False)
+
+
+def _init_worker(path: str) -> None:
+    """Open the PDF once per worker process and close it when the worker exits."""
+    global _READER
+    handle = open(path, "rb")
+    # Pool workers skip atexit on shutdown but do run multiprocessing finalizers
+    Finalize(None, handle.close, exitpriority=0)
+    _READER = _open_reader(handle)
+
+
+def _is_image_only(page: PageObject) -> bool:
+    """Return True when the page has no fonts and draws only image XObjects.
+
+    Such pages (typically scans) cannot yield text, so decoding their image
+    streams in ``extract_text()`` is pure overhead.
+    """
+    resources = page.get("/Resources")
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if resources.get("/Font"):
+        return False
+    xobjects = resources.get("/XObject")
+    if not xobjects:
+        return False
+    xobjects = xobjects.get_object()
+    # Form XObjects carry their own resources (and possibly fonts), so only skip
+    # when every XObject is an image.
+    return all(xobjects[name].get_object().get("/Subtype") == "/Image" for name in xobjects)
+
+
+def _extract_page(idx: int) -> str:
+    """Extract text of the 1-based page ``idx`` using the worker's reader."""
+    assert _READER is not None
+    try:
+        page = _READER.pages[idx - 1]
+        if _is_image_only(page):
+            return "<image-only page>\n"
+        return page.extract_text() or ""
+    except Exception as e:
+        return f"<Error extracting page {idx}: {e}>\n"
+    finally:
+        # Drop the indirect-object cache so resident memory stays flat across pages
+        # (shared fonts are re-parsed, a small price versus unbounded growth). The
+        # flattened page list is kept: resetting it would re-walk the page tree per page.
+        _READER.resolved_objects.clear()
+
+
+def _iter_pypdf(in_path: Path) -> Iterator[tuple[int, str]]:
+    """Yield (page_no, text) using pypdf, spreading pages across processes."""
+    with in_path.open("rb") as handle:
+        n_pages = len(_open_reader(handle).pages)
+    # pypdf extraction is CPU-bound, so spread pages across processes; map() yields
+    # in page order, letting each page be written as soon as it is available.
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(str(in_path),)) as ex:
+        pages = range(1, n_pages + 1)
+        yield from zip(pages, ex.map(_extract_page, pages, chunksize=8))
+
+
+def _iter_pypdfium2(in_path: Path) -> Iterator[tuple[int, str]]:
+    """Yield (page_no, text) using the C-backed pypdfium2 bindings."""
+    import pypdfium2 as pdfium  # type: ignore
+
+    doc = pdfium.PdfDocument(str(in_path))
+    try:
+        for i, page in enumerate(doc, start=1):
+            try:
+                tp = page.get_textpage()
+                try:
+                    text = tp.get_text_range()
+                finally:
+                    tp.close()
+            except Exception as e:
+                text = f"<Error extracting page {i}: {e}>\n"
+            finally:
+                page.close()
+            yield i, text
+    finally:
+        doc.close()
+
+
+def _iter_pymupdf(in_path: Path) -> Iterator[tuple[int, str]]:
+    """Yield (page_no, text) using PyMuPDF."""
+    import fitz  # type: ignore
+
+    with fitz.open(str(in_path)) as doc:
+        for i, page in enumerate(doc, start=1):
+            try:
+                text = page.get_text("text")
+            except Exception as e:
+                text = f"<Error extracting page {i}: {e}>\n"
+            yield i, text
 
 
 def main() -> int:
-    if len(sys.argv) < 3:
-        print("Usage: python scripts/extract_pdf_text.py <input.pdf> <output.txt>")
+    parser = argparse.ArgumentParser(description="Extract text from a PDF, page by page.")
+    parser.add_argument("input", type=Path, help="Input PDF path")
+    parser.add_argument("output", type=Path, help="Output text path")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="pypdf",
+        help="Extraction backend (pypdfium2/pymupdf are much faster when installed)",
+    )
+    args = parser.parse_args()
+    iter_pages = {
+        "pypdf": _iter_pypdf,
+        "pypdfium2": _iter_pypdfium2,
+        "pymupdf": _iter_pymupdf,
+    }[args.backend]
+    if importlib.util.find_spec(BACKENDS[args.backend]) is None:
+        print(f"Backend '{args.backend}' is not installed")
         return 1
-    in_path = Path(sys.argv[1])
-    out_path = Path(sys.argv[2])
-    reader = PdfReader(str(in_path))
-    lines = []
-    for i, page in enumerate(reader.pages, start=1):
-        try:
-            text = page.extract_text() or ""
-        except Exception as e:
-            text = f"<Error extracting page {i}: {e}>\n"
-        lines.append(f"\n=== Page {i} ===\n")
-        lines.append(text)
-    out_path.write_text("".join(lines), encoding="utf-8")
-    print(f"Wrote text to {out_path}")
+    with args.output.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        for i, text in iter_pages(args.input):
+            f.write(f"\n=== Page {i} ===\n")
+            f.write(text)
+    print(f"Wrote text to {args.output}")
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -1,66 +1,282 @@
 
-import pkgutil
+import ast
 import importlib
 import inspect
+import pkgutil
+import threading
+from collections.abc import Iterator, Mapping, MutableMapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
 from .base import Agent
 
-AGENT_REGISTRY: Dict[str, type[Agent]] = {}
-AGENT_IMPORT_ERRORS: Dict[str, str] = {}
-
 # Get the current package path (src/agents)
 package_path = Path(__file__).parent
 package_name = __name__
 
-# Walk through all subpackages and modules under src/agents
-for finder, modname, ispkg in pkgutil.walk_packages([str(package_path)], prefix=f"{package_name}."):
-    # Skip private modules and the base module
-    if modname.endswith(".base") or any(part.startswith("_") for part in modname.split(".")):
-        continue
+
+@lru_cache(maxsize=1)
+def _agent_module_names() -> tuple[str, ...]:
+    """Return the importable agent module names under this package (memoized).
+
+    Uses ``iter_modules`` on the package directories, so nothing is imported while
+    listing (unlike ``walk_packages``, which imports packages to recurse). Only
+    modules named ``*_agent`` are considered, and only ``*_agents`` subpackages are
+    descended into; other helpers are never imported by discovery.
+    """
+    names: list[str] = []
+
+    def _walk(path: Path, prefix: str) -> None:
+        for mi in pkgutil.iter_modules([str(path)]):
+            # Skip private modules
+            if mi.name.startswith("_"):
+                continue
+            if mi.ispkg:
+                if mi.name.endswith("_agents"):
+                    _walk(path / mi.name, f"{prefix}{mi.name}.")
+            elif mi.name.endswith("_agent"):
+                names.append(prefix + mi.name)
+
+    _walk(package_path, f"{package_name}.")
+    return tuple(names)
+
+
+def _scan_classes(modname: str) -> list[str]:
+    """Return names of top-level ``*Agent``-derived classes in ``modname``, parsed with ``ast``."""
+    # The package may be imported under a dotted name (e.g. ``src.agents``), so strip
+    # the whole prefix rather than the first component
+    rel = modname[len(package_name) + 1:] if modname.startswith(f"{package_name}.") else modname
+    source = package_path.joinpath(*rel.split(".")).with_suffix(".py")
     try:
-        module = importlib.import_module(modname)
-    except Exception as e:
-        # Record import errors for diagnostics
-        AGENT_IMPORT_ERRORS[modname] = f"{type(e).__name__}: {e}"
-        continue
-
-    # Inspect all classes in the module
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        # Only include classes that are subclass of Agent, but not Agent itself
-        try:
-            if issubclass(obj, Agent) and obj is not Agent:
-                # Last one wins on name collision
-                AGENT_REGISTRY[name] = obj
-        except Exception:
-            # Some objects may not be suitable for issubclass in edge cases
+        tree = ast.parse(source.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        # Unparseable modules are still picked up by the full import scan
+        return []
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
             continue
+        bases = [b.attr if isinstance(b, ast.Attribute) else getattr(b, "id", "") for b in node.bases]
+        if any(base.endswith("Agent") for base in bases):
+            names.append(node.name)
+    return names
+
+
+@lru_cache(maxsize=1)
+def _class_index() -> Dict[str, str]:
+    """
+    Map agent class names to their defining module without importing anything.
 
-# Load external agent entry points, if any
-try:
+    Starts from the table generated by ``scripts/build_agent_registry.py`` and parses
+    only the sources of modules added since it was built. A stale entry is harmless:
+    a lookup that misses falls back to the full import scan.
+    """
+    try:
+        from ._registry import AGENT_INDEX, AGENT_MODULES
+    except ImportError:  # pragma: no cover
+        AGENT_INDEX, AGENT_MODULES = {}, ()
+    modules = _agent_module_names()
+    on_disk = set(modules)
+    index: Dict[str, str] = {}
+    for name, rel in AGENT_INDEX.items():
+        modname = f"{package_name}.{rel}"
+        if modname in on_disk:
+            index[name] = modname
+    prebuilt = {f"{package_name}.{rel}" for rel in AGENT_MODULES}
+    for modname in modules:
+        if modname in prebuilt:
+            continue
+        for name in _scan_classes(modname):
+            # Last one wins on name collision
+            index[name] = modname
+    return index
+
+
+@lru_cache(maxsize=1)
+def _agent_entry_points() -> tuple[Any, ...]:
+    """Return the ``ftsystem.agents`` entry points, scanning distribution metadata once."""
     try:
         from importlib.metadata import entry_points  # py3.10+
     except Exception:  # pragma: no cover
-        entry_points = None  # type: ignore
-
-    if entry_points is not None:  # pragma: no cover (covered via monkeypatch in tests)
-        eps = entry_points()
-        group_eps = getattr(eps, "select", None)
-        if callable(group_eps):
-            selected = eps.select(group="ftsystem.agents")
-        else:
-            selected = eps.get("ftsystem.agents", [])  # type: ignore[attr-defined]
-        for ep in selected:
+        return ()
+    eps = entry_points()
+    if callable(getattr(eps, "select", None)):
+        return tuple(eps.select(group="ftsystem.agents"))
+    return tuple(eps.get("ftsystem.agents", []))  # type: ignore[attr-defined]
+
+
+class _LazyRegistry(MutableMapping[str, type[Agent]]):
+    """
+    Agent registry that imports agent modules on first use.
+
+    A lookup by name imports only the module defining that class; anything that needs
+    the full view (iteration, ``len``, unknown names) imports every agent module and
+    entry point once, in discovery order.
+    """
+
+    def __init__(self) -> None:
+        """Start with nothing imported."""
+        self._data: Dict[str, type[Agent]] = {}
+        self._errors: Dict[str, str] = {}
+        self._by_module: Dict[str, list[tuple[str, type[Agent]]]] = {}
+        self._explicit: set[str] = set()
+        self._complete = False
+        self._lock = threading.RLock()
+        # (lowercased names, names) sorted for prefix lookups; rebuilt after changes
+        self._name_index: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+
+    def _import(self, modname: str) -> None:
+        """Import ``modname`` once and register the Agent subclasses it exposes."""
+        if modname in self._by_module or modname in self._errors:
+            return
+        try:
+            module = importlib.import_module(modname)
+        except Exception as e:
+            # Record import errors for diagnostics
+            self._errors[modname] = f"{type(e).__name__}: {e}"
+            return
+        # Inspect all classes in the module; only include subclasses of Agent, but not
+        # Agent itself. inspect.isclass already rules out non-classes, so a failing
+        # issubclass (exotic metaclass) is exceptional and reported for the module.
+        try:
+            found = [
+                (name, obj)
+                for name, obj in inspect.getmembers(module, inspect.isclass)
+                if issubclass(obj, Agent) and obj is not Agent
+            ]
+        except Exception as e:
+            self._errors[modname] = f"{type(e).__name__}: {e}"
+            found = []
+        self._by_module[modname] = found
+        for name, obj in found:
+            if name not in self._explicit:
+                self._data[name] = obj
+
+    def _load_all(self) -> None:
+        """Import every agent module and entry point, then fix the registry order."""
+        if self._complete:
+            return
+        with self._lock:
+            if self._complete:
+                return
+            ordered: Dict[str, type[Agent]] = {}
+            for modname in _agent_module_names():
+                self._import(modname)
+                for name, obj in self._by_module.get(modname, ()):
+                    # Last one wins on name collision
+                    ordered[name] = obj
+            # Load external agent entry points, if any
             try:
-                obj = ep.load()
-                if inspect.isclass(obj) and issubclass(obj, Agent) and obj is not Agent:
-                    AGENT_REGISTRY[obj.__name__] = obj
-            except Exception as e:
-                AGENT_IMPORT_ERRORS[str(ep)] = f"{type(e).__name__}: {e}"
-except Exception:
-    # Ignore entry point loading failures silently here
-    pass
+                for ep in _agent_entry_points():  # pragma: no cover (covered via monkeypatch)
+                    try:
+                        obj = ep.load()
+                        if inspect.isclass(obj) and issubclass(obj, Agent) and obj is not Agent:
+                            ordered[obj.__name__] = obj
+                    except Exception as e:
+                        self._errors[str(ep)] = f"{type(e).__name__}: {e}"
+            except Exception:
+                # Ignore entry point loading failures silently here
+                pass
+            # Entries assigned by callers take precedence over discovery
+            for name in self._explicit:
+                ordered[name] = self._data[name]
+            self._data = ordered
+            self._name_index = None
+            self._complete = True
+
+    def __getitem__(self, name: str) -> type[Agent]:
+        """Return the agent class, importing only its module when possible."""
+        if name in self._data:
+            return self._data[name]
+        if not self._complete:
+            with self._lock:
+                modname = _class_index().get(name)
+                if modname is not None:
+                    self._import(modname)
+                    if name in self._data:
+                        return self._data[name]
+                self._load_all()
+        return self._data[name]
+
+    def __setitem__(self, name: str, cls: type[Agent]) -> None:
+        """Register ``cls`` under ``name`` (overrides discovery)."""
+        self._data[name] = cls
+        self._explicit.add(name)
+        self._name_index = None
+
+    def __delitem__(self, name: str) -> None:
+        """Remove an entry; discovery runs first so it cannot resurrect it later."""
+        self._load_all()
+        del self._data[name]
+        self._explicit.discard(name)
+        self._name_index = None
+
+    def name_index(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return (lowercased names, names), sorted case-insensitively, for ``bisect`` prefix search.
+
+        Built once after full discovery and reused until the registry changes.
+        """
+        self._load_all()
+        index = self._name_index
+        if index is None:
+            pairs = sorted((name.lower(), name) for name in self._data)
+            index = self._name_index = (tuple(low for low, _ in pairs), tuple(name for _, name in pairs))
+        return index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all agent names (triggers full discovery)."""
+        self._load_all()
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of agents (triggers full discovery)."""
+        self._load_all()
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Represent as the fully discovered mapping."""
+        self._load_all()
+        return repr(self._data)
+
+
+class _ImportErrors(Mapping[str, str]):
+    """Read-only view of agent import errors; accessing it triggers full discovery."""
+
+    def __init__(self, registry: _LazyRegistry) -> None:
+        """Bind the view to the registry that records the errors."""
+        self._registry = registry
+
+    def __getitem__(self, key: str) -> str:
+        self._registry._load_all()
+        return self._registry._errors[key]
+
+    def __iter__(self) -> Iterator[str]:
+        self._registry._load_all()
+        return iter(self._registry._errors)
+
+    def __len__(self) -> int:
+        self._registry._load_all()
+        return len(self._registry._errors)
+
+    def __repr__(self) -> str:
+        self._registry._load_all()
+        return repr(self._registry._errors)
+
+
+AGENT_REGISTRY: MutableMapping[str, type[Agent]] = _LazyRegistry()
+AGENT_IMPORT_ERRORS: Mapping[str, str] = _ImportErrors(AGENT_REGISTRY)  # type: ignore[arg-type]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve agent classes as package attributes on first access (PEP 562)."""
+    if name in _class_index():
+        try:
+            return AGENT_REGISTRY[name]
+        except KeyError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Expose registries for import
 __all__ = ["AGENT_REGISTRY", "AGENT_IMPORT_ERRORS"]
@@ -0,0 +1,25 @@
+"""Generated by scripts/build_agent_registry.py -- do not edit by hand."""
+
+AGENT_MODULES = (
+    "analyst_agent",
+    "coder_agent",
+    "config_echo_agent",
+    "critic_agent",
+    "hello_agent",
+    "master_agent",
+    "researcher_agent",
+    "slow_agent",
+    "summarizer_agent",
+)
+
+AGENT_INDEX = {
+    "AnalystAgent": "analyst_agent",
+    "CoderAgent": "coder_agent",
+    "ConfigEchoAgent": "config_echo_agent",
+    "CriticAgent": "critic_agent",
+    "HelloAgent": "hello_agent",
+    "MasterAgent": "master_agent",
+    "ResearcherAgent": "researcher_agent",
+    "SlowAgent": "slow_agent",
+    "SummarizerAgent": "summarizer_agent",
+}
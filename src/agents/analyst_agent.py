@@ -1,7 +1,8 @@
 """Analyst Agent for data analysis, pattern recognition, and insights."""
 
 import logging
-from typing import Any, Dict, List
+import re
+from typing import Any, ClassVar, Dict, List, Optional
 from .base import Agent, AgentConfig
 
 
@@ -13,6 +14,39 @@ class AnalystAgent(Agent):
     with confidence scoring and recommendation generation.
     """
 
+    # Analysis-type-specific templates. Pattern dicts are copied before being returned;
+    # strings are immutable and appended by reference.
+    _TYPE_PATTERNS: ClassVar[Dict[str, Dict[str, Any]]] = {
+        "trend": {
+            "type": "temporal_trend",
+            "description": "Time-based pattern detected",
+            "significance": 0.8,
+        },
+        "anomaly": {
+            "type": "outlier_detection",
+            "description": "Anomalous values identified",
+            "significance": 0.75,
+        },
+        "correlation": {
+            "type": "correlation_matrix",
+            "description": "Relationships between variables detected",
+            "significance": 0.82,
+        },
+    }
+    _TYPE_INSIGHTS: ClassVar[Dict[str, str]] = {
+        "trend": "Upward or downward trends may be present in time-series data",
+        "anomaly": "Outliers could indicate measurement errors or significant events",
+        "correlation": "Variable relationships may indicate causal or correlative connections",
+    }
+    _TYPE_RECOMMENDATIONS: ClassVar[Dict[str, str]] = {
+        "trend": "Consider forecasting methods for trend analysis",
+        "anomaly": "Investigate outliers to determine if they are errors or significant events",
+        "correlation": "Perform statistical tests to validate potential correlations",
+    }
+    # Analysis types that add a dedicated recommendation
+    _KEYWORD_ANALYSIS_TYPES = frozenset(_TYPE_RECOMMENDATIONS)
+    _KEYWORD_RE = re.compile("|".join(_TYPE_RECOMMENDATIONS))
+
     def __init__(self, config: AgentConfig):
         """
         Initialize the Analyst Agent.
@@ -22,7 +56,7 @@ class AnalystAgent(Agent):
                    Supports params: analysis_type (str), min_confidence (float).
         """
         super().__init__(config)
-        logging.debug(f"AnalystAgent initialized with config: {config.name}")
+        logging.debug("AnalystAgent initialized with config: %s", config.name)
 
     def run(self, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -59,14 +93,15 @@ class AnalystAgent(Agent):
             analysis_type = self.config.params.get("analysis_type", "general")
             min_confidence = self.config.params.get("min_confidence", 0.6)
         
-        logging.info(f"[Analyst] Starting {analysis_type} analysis")
-        logging.debug(f"[Analyst] Data type: {type(data).__name__}, min_confidence: {min_confidence}")
+        logging.info("[Analyst] Starting %s analysis", analysis_type)
+        logging.debug("[Analyst] Data type: %s, min_confidence: %s", type(data).__name__, min_confidence)
         
         # Perform analysis
         data_quality = self._assess_data_quality(data)
         patterns = self._identify_patterns(data, analysis_type)
         insights = self._extract_insights(patterns, data, analysis_type)
-        recommendations = self._generate_recommendations(insights, context)
+        flags = frozenset({analysis_type}) & self._KEYWORD_ANALYSIS_TYPES
+        recommendations = self._generate_recommendations(insights, context, flags)
         confidence = self._calculate_confidence(patterns, insights, data_quality)
         
         result = {
@@ -78,7 +113,12 @@ class AnalystAgent(Agent):
             "data_quality": data_quality,
         }
         
-        logging.info(f"[Analyst] Analysis complete: {len(patterns)} patterns, {len(insights)} insights, confidence={confidence:.2f}")
+        logging.info(
+            "[Analyst] Analysis complete: %d patterns, %d insights, confidence=%.2f",
+            len(patterns),
+            len(insights),
+            confidence,
+        )
         return result
 
     def _assess_data_quality(self, data: Any) -> Dict[str, Any]:
@@ -113,7 +153,11 @@ class AnalystAgent(Agent):
             quality["type"] = "other"
             quality["completeness"] = 0.85
         
-        logging.debug(f"[Analyst] Data quality: size={quality['size']}, completeness={quality['completeness']:.2f}")
+        logging.debug(
+            "[Analyst] Data quality: size=%s, completeness=%.2f",
+            quality["size"],
+            quality["completeness"],
+        )
         return quality
 
     def _identify_patterns(self, data: Any, analysis_type: str) -> List[Dict[str, Any]]:
@@ -137,26 +181,11 @@ class AnalystAgent(Agent):
             patterns.extend(self._analyze_list_patterns(data))
         
         # Add analysis-type-specific patterns
-        if analysis_type == "trend":
-            patterns.append({
-                "type": "temporal_trend",
-                "description": "Time-based pattern detected",
-                "significance": 0.8,
-            })
-        elif analysis_type == "anomaly":
-            patterns.append({
-                "type": "outlier_detection",
-                "description": "Anomalous values identified",
-                "significance": 0.75,
-            })
-        elif analysis_type == "correlation":
-            patterns.append({
-                "type": "correlation_matrix",
-                "description": "Relationships between variables detected",
-                "significance": 0.82,
-            })
+        type_pattern = self._TYPE_PATTERNS.get(analysis_type)
+        if type_pattern is not None:
+            patterns.append(dict(type_pattern))
         
-        logging.debug(f"[Analyst] Identified {len(patterns)} patterns")
+        logging.debug("[Analyst] Identified %d patterns", len(patterns))
         return patterns
 
     def _analyze_dict_patterns(self, data: Dict) -> List[Dict[str, Any]]:
@@ -217,50 +246,48 @@ class AnalystAgent(Agent):
             insights.append(insight)
         
         # Add analysis-type-specific insights
-        if analysis_type == "trend":
-            insights.append("Upward or downward trends may be present in time-series data")
-        elif analysis_type == "anomaly":
-            insights.append("Outliers could indicate measurement errors or significant events")
-        elif analysis_type == "correlation":
-            insights.append("Variable relationships may indicate causal or correlative connections")
+        type_insight = self._TYPE_INSIGHTS.get(analysis_type)
+        if type_insight is not None:
+            insights.append(type_insight)
         
         if isinstance(data, (dict, list)) and len(data) > 0:
             insights.append(f"Data contains {len(data)} distinct elements for analysis")
         
-        logging.debug(f"[Analyst] Extracted {len(insights)} insights")
+        logging.debug("[Analyst] Extracted %d insights", len(insights))
         return insights
 
-    def _generate_recommendations(self, insights: List[str], context: str = "") -> List[str]:
+    def _generate_recommendations(self, insights: List[str], context: str = "",
+                                  flags: Optional[frozenset] = None) -> List[str]:
         """
         Generate recommendations based on extracted insights.
         
         Args:
             insights: Extracted insights.
             context: Additional context for recommendations.
+            flags: Analysis keywords ("trend", "anomaly", "correlation") that apply.
+                   When omitted they are detected in the insight texts in one pass.
         
         Returns:
             List of recommendation strings.
         """
         recommendations = []
         
+        if flags is None:
+            flags = frozenset(self._KEYWORD_RE.findall("\n".join(insights)))
+        
         if len(insights) > 0:
             recommendations.append("Review identified patterns for actionable implications")
         
-        if "trend" in str(insights):
-            recommendations.append("Consider forecasting methods for trend analysis")
-        
-        if "anomaly" in str(insights):
-            recommendations.append("Investigate outliers to determine if they are errors or significant events")
-        
-        if "correlation" in str(insights):
-            recommendations.append("Perform statistical tests to validate potential correlations")
+        for keyword, recommendation in self._TYPE_RECOMMENDATIONS.items():
+            if keyword in flags:
+                recommendations.append(recommendation)
         
         if context:
             recommendations.append(f"Consider context in interpretation: {context}")
         
         recommendations.append("Document analysis methodology for reproducibility")
         
-        logging.debug(f"[Analyst] Generated {len(recommendations)} recommendations")
+        logging.debug("[Analyst] Generated %d recommendations", len(recommendations))
         return recommendations
 
     def _calculate_confidence(self, patterns: List[Dict], insights: List[str], 
@@ -289,6 +316,11 @@ class AnalystAgent(Agent):
         
         confidence = min(1.0, base_confidence + pattern_factor + insight_factor + quality_factor)
         
-        logging.debug(f"[Analyst] Confidence calculation: base=0.5, patterns={pattern_factor:.2f}, insights={insight_factor:.2f}, quality={quality_factor:.2f}")
+        logging.debug(
+            "[Analyst] Confidence calculation: base=0.5, patterns=%.2f, insights=%.2f, quality=%.2f",
+            pattern_factor,
+            insight_factor,
+            quality_factor,
+        )
         
         return confidence
@@ -1,12 +1,29 @@
 
 # src/agents/base.py
 
+import functools
 from abc import ABC, abstractmethod
-from pydantic import BaseModel
-from typing import Any, Dict, Union, List, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Union, List, Optional, Literal, Self
 from datetime import datetime, timezone
 
-class AgentConfig(BaseModel):
+class TrustedModel(BaseModel):
+    """
+    Base model with a validation-free constructor for internal, already-valid data.
+    """
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """
+        Build an instance without validation (``model_construct``).
+
+        Only use for data produced internally; external input (config files, CLI)
+        must go through the validating constructor.
+        """
+        return cls.model_construct(**data)
+
+
+class AgentConfig(TrustedModel):
     """
     Base configuration model for an agent.
     All agent configurations should inherit from this class.
@@ -31,12 +48,27 @@ class Agent(ABC):
         """
         pass
 
+    async def arun(self, **kwargs: Any) -> Any:
+        """
+        Execute the agent's task from async code.
+
+        The default runs ``run`` in the event loop's executor. Agents whose work is
+        naturally awaitable (I/O, timers) override this so orchestrators can run many
+        of them concurrently without occupying a thread each.
+        """
+        # Imported here: asyncio is the costliest import on the CLI's startup path, and
+        # synchronous commands never need it
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.run, **kwargs))
+
 
 # JSON-like type alias for agent results
 JSONLike = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
 
-class RunResult(BaseModel):
+class RunResult(TrustedModel):
     """
     Standardized result container for agents.
     """
@@ -46,7 +78,7 @@ class RunResult(BaseModel):
     metrics: Optional[Dict[str, float]] = None
 
 
-class SessionSummary(BaseModel):
+class SessionSummary(TrustedModel):
     """
     Persistent session summary for long-term memory.
     """
@@ -57,12 +89,21 @@ class SessionSummary(BaseModel):
     data_preview: Optional[str] = None
     tags: Optional[list[str]] = None
 
+    def to_json_bytes(self) -> bytes:
+        """Serialise to compact UTF-8 JSON bytes, ready to append to a history file."""
+        # Same serializer as model_dump_json, minus the decode to str and re-encode
+        return self.__pydantic_serializer__.to_json(self)
+
 
-class Message(BaseModel):
+class Message(TrustedModel):
     """
     Forum message used in orchestration transcripts.
+
+    Messages are immutable once posted, so transcripts cannot be edited after the fact.
     """
+    model_config = ConfigDict(frozen=True)
+
     role: Literal["system", "user", "agent"]
     agent: Optional[str] = None
     content: str
-    timestamp: datetime = datetime.now(timezone.utc)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
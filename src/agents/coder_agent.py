@@ -1,10 +1,48 @@
 """Coder Agent for code generation, analysis, and refactoring tasks."""
 
 import logging
+import re
+from functools import lru_cache
 from typing import Any, Dict, List
 from .base import Agent, AgentConfig
 
 
+# Per-language marker rules: marker -> (severity, message). Each language's markers are
+# fused into one compiled alternation so the code is scanned once however many rules exist.
+_MARKER_RULES: Dict[str, Dict[str, tuple[str, str]]] = {
+    "python": {
+        "import": ("warning", "Imports should be at the top of the file"),
+    },
+    "javascript": {
+        "var ": ("warning", "Use 'let' or 'const' instead of 'var' for better scoping"),
+    },
+    "java": {
+        "System.out.println": ("info", "Consider using a logging framework for production code"),
+    },
+}
+_MARKER_PATTERNS = {
+    language: re.compile("|".join(re.escape(marker) for marker in rules))
+    for language, rules in _MARKER_RULES.items()
+}
+
+
+def _scan_markers(code: str, language: str) -> set[str]:
+    """Return the rule markers of ``language`` present in ``code`` (single pass)."""
+    wanted = len(_MARKER_RULES[language])
+    found: set[str] = set()
+    for match in _MARKER_PATTERNS[language].finditer(code):
+        found.add(match.group())
+        if len(found) == wanted:
+            break
+    return found
+
+
+def _marker_warning(language: str, marker: str) -> Dict[str, Any]:
+    """Build the warning entry for a matched marker rule."""
+    severity, message = _MARKER_RULES[language][marker]
+    return {"severity": severity, "message": message}
+
+
 class CoderAgent(Agent):
     """
     Specialized agent for code generation, analysis, and refactoring.
@@ -22,7 +60,7 @@ class CoderAgent(Agent):
                    Supports params: language (str), code_style (str).
         """
         super().__init__(config)
-        logging.debug(f"CoderAgent initialized with config: {config.name}")
+        logging.debug("CoderAgent initialized with config: %s", config.name)
 
     def run(self, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -56,11 +94,11 @@ class CoderAgent(Agent):
         # Validate language
         language = language.lower()
         if language not in self._SUPPORTED_LANGUAGES:
-            logging.warning(f"Unsupported language '{language}', defaulting to python")
+            logging.warning("Unsupported language '%s', defaulting to python", language)
             language = "python"
         
-        logging.info(f"[Coder] Processing task: {task[:50]}..." if len(task) > 50 else f"[Coder] Processing task: {task}")
-        logging.debug(f"[Coder] language={language}, has_existing_code={bool(existing_code)}")
+        logging.info("[Coder] Processing task: %.50s%s", task, "..." if len(task) > 50 else "")
+        logging.debug("[Coder] language=%s, has_existing_code=%s", language, bool(existing_code))
         
         # Generate or analyze code
         if existing_code:
@@ -80,7 +118,11 @@ class CoderAgent(Agent):
             "syntax_valid": syntax_valid,
         }
         
-        logging.info(f"[Coder] Task complete: {len(code.splitlines())} lines generated, {len(warnings)} warnings")
+        logging.info(
+            "[Coder] Task complete: %d lines generated, %d warnings",
+            len(code.splitlines()),
+            len(warnings),
+        )
         return result
 
     def _generate_code(self, task: str, language: str) -> tuple[str, str]:
@@ -94,14 +136,10 @@ class CoderAgent(Agent):
         Returns:
             Tuple of (generated_code, explanation).
         """
-        # Simulate code generation (in production, would use LLM)
-        templates = {
-            "python": self._generate_python_code(task),
-            "javascript": self._generate_javascript_code(task),
-            "java": self._generate_java_code(task),
-        }
-        
-        code = templates.get(language, self._generate_python_code(task))
+        # Simulate code generation (in production, would use LLM); only the selected
+        # generator runs.
+        generate = self._GENERATORS.get(language, self._generate_python_code)
+        code = generate(task)
         explanation = f"Generated {language} code to: {task}"
         
         return code, explanation
@@ -158,12 +196,10 @@ class CoderAgent(Agent):
     def _validate_python(self, code: str) -> List[Dict[str, Any]]:
         """Validate Python code syntax and best practices."""
         warnings = []
+        found = _scan_markers(code, "python")
         
-        if "import" in code and not code.startswith("import") and not code.startswith("from"):
-            warnings.append({
-                "severity": "warning",
-                "message": "Imports should be at the top of the file",
-            })
+        if "import" in found and not code.startswith(("import", "from")):
+            warnings.append(_marker_warning("python", "import"))
         
         if len(code) > 1000:
             warnings.append({
@@ -175,31 +211,22 @@ class CoderAgent(Agent):
 
     def _validate_javascript(self, code: str) -> List[Dict[str, Any]]:
         """Validate JavaScript code syntax and best practices."""
-        warnings = []
-        
-        if "var " in code:
-            warnings.append({
-                "severity": "warning",
-                "message": "Use 'let' or 'const' instead of 'var' for better scoping",
-            })
-        
-        return warnings
+        found = _scan_markers(code, "javascript")
+        return [_marker_warning("javascript", m) for m in _MARKER_RULES["javascript"] if m in found]
 
     def _validate_java(self, code: str) -> List[Dict[str, Any]]:
         """Validate Java code syntax and best practices."""
-        warnings = []
-        
-        if "System.out.println" in code:
-            warnings.append({
-                "severity": "info",
-                "message": "Consider using a logging framework for production code",
-            })
-        
-        return warnings
+        found = _scan_markers(code, "java")
+        return [_marker_warning("java", m) for m in _MARKER_RULES["java"] if m in found]
 
-    def _generate_python_code(self, task: str) -> str:
+    # Templates are pure functions of the task, so identical tasks (common across
+    # orchestration rounds) reuse the rendered string.
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_python_code(task: str) -> str:
         """Generate Python code template."""
-        return f'''def {task.replace(" ", "_").lower()}():
+        func_name = task.replace(" ", "_").lower()
+        return f'''def {func_name}():
     """
     {task}
     
@@ -212,11 +239,13 @@ class CoderAgent(Agent):
 
 
 if __name__ == "__main__":
-    result = {task.replace(" ", "_").lower()}()
+    result = {func_name}()
     print(f"Task result: {{result}}")
 '''
 
-    def _generate_javascript_code(self, task: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_javascript_code(task: str) -> str:
         """Generate JavaScript code template."""
         func_name = "".join(word.capitalize() if i > 0 else word.lower() 
                            for i, word in enumerate(task.split()))
@@ -235,7 +264,9 @@ const result = {func_name}();
 console.log("Task result:", result);
 '''
 
-    def _generate_java_code(self, task: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_java_code(task: str) -> str:
         """Generate Java code template."""
         class_name = "".join(word.capitalize() for word in task.split())
         return f'''public class {class_name} {{
@@ -256,4 +287,11 @@ console.log("Task result:", result);
 }}
 '''
 
-    _SUPPORTED_LANGUAGES = ["python", "javascript", "java", "csharp", "go", "rust"]
+    _SUPPORTED_LANGUAGES = frozenset({"python", "javascript", "java", "csharp", "go", "rust"})
+
+    # Language -> template generator (staticmethods are directly callable)
+    _GENERATORS = {
+        "python": _generate_python_code,
+        "javascript": _generate_javascript_code,
+        "java": _generate_java_code,
+    }
@@ -1,10 +1,84 @@
 """Critic Agent for peer review, quality validation, and constructive feedback."""
 
 import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List
 from .base import Agent, AgentConfig
 
 
+# Markers are ASCII, so they are searched in the UTF-8 bytes of the content, where
+# CPython's substring search runs on raw bytes. "unclear" is case-insensitive.
+_UNCLEAR_RE = re.compile(rb"(?i)unclear")
+
+# Quality dimensions in reporting order, with their base scores; adjustments are
+# applied by index and the dict is built once on return.
+_DIM_NAMES = ("accuracy", "completeness", "clarity", "consistency", "structure")
+_BASE_SCORES = (0.85, 0.80, 0.88, 0.90, 0.82)
+_DIM_COUNT = len(_DIM_NAMES)
+_I_COMPLETENESS = 1
+_I_CLARITY = 2
+
+# Strictness level -> score adjustment and (approval, rejection) thresholds;
+# unknown levels are treated as "balanced".
+_STRICTNESS_DELTA = {"strict": -0.05, "lenient": 0.05}
+_THRESHOLDS = {
+    "strict": (0.85, 0.70),
+    "lenient": (0.70, 0.50),
+    "balanced": (0.80, 0.60),
+}
+
+# (dimension, threshold, suggestion) for scores that call for improvement
+_SCORE_RULES = (
+    ("clarity", 0.85, "Improve clarity by simplifying complex sentences and removing jargon"),
+    ("completeness", 0.85, "Add missing sections or expand existing ones for better coverage"),
+    ("accuracy", 0.85, "Verify facts and claims; provide citations where possible"),
+    ("consistency", 0.85, "Ensure consistent terminology and formatting throughout"),
+)
+# (issue type, suggestion) for identified issues
+_ISSUE_RULES = (
+    ("incomplete_work", "Complete all marked TODO/FIXME items before submission"),
+    ("unclear_sections", "Clarify uncertain or ambiguous passages with specific details"),
+)
+# (context keyword, suggestions) matched case-insensitively against the review context
+_CONTEXT_RULES = (
+    ("code", ("Add comments explaining complex logic", "Include docstrings for all functions and classes")),
+    ("report", ("Add executive summary at the beginning", "Include references and source citations")),
+)
+_DEFAULT_SUGGESTION = "Overall content is good; minor polish recommended"
+
+
+@dataclass(frozen=True, slots=True)
+class _ContentFeatures:
+    """Everything the review helpers need from the content, computed in one pass."""
+
+    length: int
+    has_incomplete_markers: bool  # TODO / FIXME
+    has_unclear_markers: bool  # ??? / unclear (any case)
+    triple_newlines: int
+
+    @classmethod
+    def from_content(cls, content: str) -> "_ContentFeatures":
+        """Scan ``content`` once and capture its review-relevant features."""
+        # surrogatepass: lone surrogates must not turn into "?" and fake a "???" marker
+        buf = content.encode("utf-8", "surrogatepass")
+        return cls(
+            length=len(content),
+            has_incomplete_markers=b"TODO" in buf or b"FIXME" in buf,
+            has_unclear_markers=b"???" in buf or _UNCLEAR_RE.search(buf) is not None,
+            triple_newlines=buf.count(b"\n\n\n"),
+        )
+
+
+# Hits come from the same few outputs being re-reviewed in consecutive rounds, so a
+# small cache keeps nearly all of them without pinning many large strings in memory.
+@lru_cache(maxsize=8)
+def _content_features(content: str) -> _ContentFeatures:
+    """Memoized feature scan, so content re-reviewed across rounds is scanned once."""
+    return _ContentFeatures.from_content(content)
+
+
 class CriticAgent(Agent):
     """
     Specialized agent for reviewing and validating outputs from other agents.
@@ -22,7 +96,7 @@ class CriticAgent(Agent):
                    Supports params: strictness_level (str), criteria (list).
         """
         super().__init__(config)
-        logging.debug(f"CriticAgent initialized with config: {config.name}")
+        logging.debug("CriticAgent initialized with config: %s", config.name)
 
     def run(self, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -61,15 +135,19 @@ class CriticAgent(Agent):
             if not criteria:
                 criteria = self.config.params.get("criteria", [])
         
-        logging.info(f"[Critic] Starting review: strictness={strictness_level}")
-        logging.debug(f"[Critic] Content length: {len(content)}, criteria: {len(criteria)}")
+        logging.info("[Critic] Starting review: strictness=%s", strictness_level)
+        logging.debug("[Critic] Content length: %d, criteria: %d", len(content), len(criteria))
         
         # Perform multi-dimensional review
-        quality_scores = self._evaluate_quality(content, strictness_level)
-        issues = self._identify_issues(content, strictness_level)
+        features = _content_features(content)
+        quality_scores = self._evaluate_quality(features, strictness_level)
+        issues = self._identify_issues(features, strictness_level)
         suggestions = self._generate_suggestions(quality_scores, issues, context)
-        approval_status = self._determine_approval(quality_scores, issues, strictness_level)
-        overall_score = sum(quality_scores.values()) / len(quality_scores) if quality_scores else 0.0
+        # Every dimension is always scored, so the divisor is fixed. Plain summation is
+        # kept over statistics.fmean: fmean rounds differently in the last bit, which
+        # would flip decisions for scores sitting exactly on a threshold.
+        overall_score = sum(quality_scores.values()) / _DIM_COUNT
+        approval_status = self._determine_approval(overall_score, issues, strictness_level)
         
         content_preview = content[:100] + "..." if len(content) > 100 else content
         
@@ -82,59 +160,58 @@ class CriticAgent(Agent):
             "approval_status": approval_status,
         }
         
-        logging.info(f"[Critic] Review complete: overall_score={overall_score:.2f}, status={approval_status}")
+        logging.info(
+            "[Critic] Review complete: overall_score=%.2f, status=%s",
+            overall_score,
+            approval_status,
+        )
         return result
 
-    def _evaluate_quality(self, content: str, strictness: str) -> Dict[str, float]:
+    @staticmethod
+    def _evaluate_quality(features: _ContentFeatures, strictness: str) -> Dict[str, float]:
         """
         Evaluate content quality across multiple dimensions.
         
         Args:
-            content: Content to evaluate.
+            features: Precomputed features of the content to evaluate.
             strictness: Review strictness level (lenient, balanced, strict).
         
         Returns:
             Dictionary of quality scores (0.0-1.0) for each dimension.
         """
         # Base scores for dimensions
-        scores = {
-            "accuracy": 0.85,
-            "completeness": 0.80,
-            "clarity": 0.88,
-            "consistency": 0.90,
-            "structure": 0.82,
-        }
+        values = list(_BASE_SCORES)
         
         # Adjust based on content characteristics
-        if len(content) < 50:
-            scores["completeness"] -= 0.15
-        elif len(content) > 5000:
-            scores["clarity"] -= 0.10
+        if features.length < 50:
+            values[_I_COMPLETENESS] -= 0.15
+        elif features.length > 5000:
+            values[_I_CLARITY] -= 0.10
         
         # Check for common quality issues
-        if "TODO" in content or "FIXME" in content:
-            scores["completeness"] -= 0.20
+        if features.has_incomplete_markers:
+            values[_I_COMPLETENESS] -= 0.20
+        
+        if features.has_unclear_markers:
+            values[_I_CLARITY] -= 0.15
         
-        if "???" in content or "unclear" in content.lower():
-            scores["clarity"] -= 0.15
+        # Apply strictness adjustment (lower for strict, higher for lenient)
+        delta = _STRICTNESS_DELTA.get(strictness)
+        if delta:
+            values = [min(1.0, max(0.0, v + delta)) for v in values]
         
-        # Apply strictness adjustment
-        if strictness == "strict":
-            # Reduce all scores slightly for stricter evaluation
-            scores = {k: max(0.0, v - 0.05) for k, v in scores.items()}
-        elif strictness == "lenient":
-            # Increase all scores slightly for lenient evaluation
-            scores = {k: min(1.0, v + 0.05) for k, v in scores.items()}
+        scores = dict(zip(_DIM_NAMES, values))
         
-        logging.debug(f"[Critic] Quality scores: {scores}")
+        logging.debug("[Critic] Quality scores: %s", scores)
         return scores
 
-    def _identify_issues(self, content: str, strictness: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _identify_issues(features: _ContentFeatures, strictness: str) -> List[Dict[str, Any]]:
         """
         Identify issues and problems in the content.
         
         Args:
-            content: Content to analyze for issues.
+            features: Precomputed features of the content to analyze.
             strictness: Review strictness level.
         
         Returns:
@@ -143,7 +220,7 @@ class CriticAgent(Agent):
         issues = []
         
         # Check for length issues
-        if len(content) < 50:
+        if features.length < 50:
             issues.append({
                 "severity": "warning",
                 "type": "insufficient_content",
@@ -151,7 +228,7 @@ class CriticAgent(Agent):
             })
         
         # Check for incomplete markers
-        if "TODO" in content or "FIXME" in content:
+        if features.has_incomplete_markers:
             issues.append({
                 "severity": "error" if strictness == "strict" else "warning",
                 "type": "incomplete_work",
@@ -159,7 +236,7 @@ class CriticAgent(Agent):
             })
         
         # Check for unclear passages
-        if "???" in content or "unclear" in content.lower():
+        if features.has_unclear_markers:
             issues.append({
                 "severity": "warning",
                 "type": "unclear_sections",
@@ -167,18 +244,19 @@ class CriticAgent(Agent):
             })
         
         # Check for consistency
-        if content.count("\n\n\n") > 0:
+        if features.triple_newlines > 0:
             issues.append({
                 "severity": "info",
                 "type": "formatting",
                 "description": "Excessive blank lines detected",
             })
         
-        logging.debug(f"[Critic] Issues found: {len(issues)}")
+        logging.debug("[Critic] Issues found: %d", len(issues))
         return issues
 
-    def _generate_suggestions(self, quality_scores: Dict[str, float], 
-                            issues: List[Dict], context: str = "") -> List[str]:
+    @staticmethod
+    def _generate_suggestions(quality_scores: Dict[str, float],
+                              issues: List[Dict], context: str = "") -> List[str]:
         """
         Generate constructive improvement suggestions.
         
@@ -190,71 +268,56 @@ class CriticAgent(Agent):
         Returns:
             List of suggestion strings.
         """
-        suggestions = []
-        
         # Base on low scores
-        if quality_scores.get("clarity", 1.0) < 0.85:
-            suggestions.append("Improve clarity by simplifying complex sentences and removing jargon")
-        
-        if quality_scores.get("completeness", 1.0) < 0.85:
-            suggestions.append("Add missing sections or expand existing ones for better coverage")
-        
-        if quality_scores.get("accuracy", 1.0) < 0.85:
-            suggestions.append("Verify facts and claims; provide citations where possible")
-        
-        if quality_scores.get("consistency", 1.0) < 0.85:
-            suggestions.append("Ensure consistent terminology and formatting throughout")
+        suggestions = [
+            suggestion
+            for key, threshold, suggestion in _SCORE_RULES
+            if quality_scores.get(key, 1.0) < threshold
+        ]
         
         # Base on identified issues
-        if any(i["type"] == "incomplete_work" for i in issues):
-            suggestions.append("Complete all marked TODO/FIXME items before submission")
-        
-        if any(i["type"] == "unclear_sections" for i in issues):
-            suggestions.append("Clarify uncertain or ambiguous passages with specific details")
+        if issues:
+            types_seen = {i["type"] for i in issues}
+            suggestions += [suggestion for issue_type, suggestion in _ISSUE_RULES if issue_type in types_seen]
         
         # Base on context
-        if context and "code" in context.lower():
-            suggestions.append("Add comments explaining complex logic")
-            suggestions.append("Include docstrings for all functions and classes")
-        
-        if context and "report" in context.lower():
-            suggestions.append("Add executive summary at the beginning")
-            suggestions.append("Include references and source citations")
+        if context:
+            context = context.lower()
+            for keyword, extra in _CONTEXT_RULES:
+                if keyword in context:
+                    suggestions.extend(extra)
         
         # Generic improvement suggestion
-        if len(suggestions) == 0:
-            suggestions.append("Overall content is good; minor polish recommended")
+        if not suggestions:
+            suggestions = [_DEFAULT_SUGGESTION]
         
-        logging.debug(f"[Critic] Generated {len(suggestions)} suggestions")
+        logging.debug("[Critic] Generated %d suggestions", len(suggestions))
         return suggestions
 
-    def _determine_approval(self, quality_scores: Dict[str, float], 
-                           issues: List[Dict], strictness: str) -> str:
+    @staticmethod
+    def _determine_approval(overall_score: float,
+                            issues: List[Dict], strictness: str) -> str:
         """
         Determine approval status based on quality and issues.
         
         Args:
-            quality_scores: Quality scores for each dimension.
+            overall_score: Mean of the quality scores, as computed by run().
             issues: Identified issues.
             strictness: Review strictness level.
         
         Returns:
             Approval status: "approved", "needs_revision", or "rejected".
         """
-        overall_score = sum(quality_scores.values()) / len(quality_scores) if quality_scores else 0.0
-        error_count = sum(1 for i in issues if i["severity"] == "error")
-        warning_count = sum(1 for i in issues if i["severity"] == "warning")
+        error_count = warning_count = 0
+        for issue in issues:
+            severity = issue["severity"]
+            if severity == "warning":
+                warning_count += 1
+            elif severity == "error":
+                error_count += 1
         
         # Determine thresholds based on strictness
-        if strictness == "strict":
-            approval_threshold = 0.85
-            rejection_threshold = 0.70
-        elif strictness == "lenient":
-            approval_threshold = 0.70
-            rejection_threshold = 0.50
-        else:  # balanced
-            approval_threshold = 0.80
-            rejection_threshold = 0.60
+        approval_threshold, rejection_threshold = _THRESHOLDS.get(strictness, _THRESHOLDS["balanced"])
         
         # Decision logic
         if error_count > 0:
@@ -266,5 +329,11 @@ class CriticAgent(Agent):
         else:
             status = "rejected"
         
-        logging.debug(f"[Critic] Approval decision: {status} (score={overall_score:.2f}, errors={error_count}, warnings={warning_count})")
+        logging.debug(
+            "[Critic] Approval decision: %s (score=%.2f, errors=%d, warnings=%d)",
+            status,
+            overall_score,
+            error_count,
+            warning_count,
+        )
         return status
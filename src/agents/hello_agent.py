@@ -1,7 +1,11 @@
 
 import logging
+import sys
 from .base import Agent, AgentConfig
-from typing import Any
+from typing import Any, Final
+
+# Shared greeting returned by every run
+_GREETING: Final[str] = sys.intern("Hello, world!")
 
 class HelloAgent(Agent):
     """
@@ -13,6 +17,5 @@ class HelloAgent(Agent):
 
     def run(self, **kwargs: Any) -> str:
         """Log a static greeting and return it for downstream consumers."""
-        message = "Hello, world!"
-        logging.info(message)
-        return message
+        logging.info(_GREETING)
+        return _GREETING
@@ -1,5 +1,8 @@
 import asyncio
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 from typing import Any, Dict
 
 from .base import Agent, AgentConfig
@@ -7,6 +10,37 @@ from agents import AGENT_REGISTRY
 from core.forum import Forum
 from core.security import SecurityPolicy, Redactor
 
+# Sub-agents whose run() is cheap and non-blocking; they are called inline on the
+# event loop, since a thread hop would cost more than the work itself.
+_TRIVIAL_AGENTS = frozenset({"HelloAgent"})
+
+# Upper bound on the transcript body posted for a structured sub-agent result
+_FORUM_BODY_LIMIT = 4096
+
+
+def _forum_body(res: Any) -> str:
+    """Render a sub-agent result for the forum transcript.
+
+    Strings are posted as-is. Structured results are serialized as JSON (falling back
+    to ``str`` for values JSON cannot encode, such as non-string keys or cycles) and
+    capped at ``_FORUM_BODY_LIMIT`` characters (the full value stays in ``results``).
+    """
+    if isinstance(res, str):
+        return res
+    try:
+        body = json.dumps(res, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        body = str(res)
+    if len(body) > _FORUM_BODY_LIMIT:
+        body = body[: _FORUM_BODY_LIMIT - 4]
+        # Prefer cutting at a separator so no token is split before redaction, unless
+        # that would throw away most of the body (e.g. one long value)
+        sep = max(body.rfind(c) for c in " ,:")
+        if sep >= len(body) // 2:
+            body = body[:sep]
+        body += " ..."
+    return body
+
 
 class MasterAgent(Agent):
     """
@@ -28,9 +62,9 @@ class MasterAgent(Agent):
             self.config.params,
             bool(user_input),
         )
-        forum.post("system", "MasterAgent starting orchestration", agent="MasterAgent")
+        forum.post_trusted("system", "MasterAgent starting orchestration", agent="MasterAgent")
         if user_input:
-            forum.post("user", Redactor.redact(str(user_input)) or "")
+            forum.post_trusted("user", Redactor.redact(str(user_input)) or "")
         rounds = 1
         timeout_s = None
         if self.config.params:
@@ -42,60 +76,40 @@ class MasterAgent(Agent):
             except Exception:
                 pass
 
+        # Selection depends only on params, the registry and the policy, so resolve it
+        # once for all rounds.
+        selected = self._resolve_selection(policy)
+        # Sub-agent configs are identical every round; build them once as well
+        configs = {
+            name: AgentConfig.from_trusted(name=name, description=f"Auto for {name}") for name, _ in selected
+        }
+
         async def _run_round_once() -> Dict[str, Any]:
             results: Dict[str, Any] = {}
             latencies: Dict[str, float] = {}
 
             async def _run_one(name: str, cls: type[Agent]) -> None:
                 try:
-                    start = asyncio.get_event_loop().time()
+                    start = perf_counter()
                     logging.debug("[master] starting subagent %s", name)
-                    res = await asyncio.to_thread(
-                        lambda: cls(AgentConfig(name=name, description=f"Auto for {name}")).run()
-                    )
+                    agent = cls(configs[name])
+                    if name in _TRIVIAL_AGENTS:
+                        res = agent.run()
+                    elif cls.arun is not Agent.arun:
+                        # Natively async agents are awaited on the loop (no thread)
+                        res = await agent.arun()
+                    else:
+                        res = await asyncio.get_running_loop().run_in_executor(pool, agent.run)
                     results[name] = res
-                    forum.post("agent", Redactor.redact(str(res)) or "", agent=name)
-                    latencies[name] = asyncio.get_event_loop().time() - start
+                    forum.post_trusted("agent", Redactor.redact(_forum_body(res)) or "", agent=name)
+                    latencies[name] = perf_counter() - start
                     logging.debug("[master] finished subagent %s (latency=%.3fs)", name, latencies[name])
                 except Exception as e:  # pragma: no cover
                     err_msg = f"{type(e).__name__} while running {name}: {e}"
                     logging.error(err_msg)
                     results[name] = {"error": err_msg}
 
-            wanted = []
-            if self.config.params and isinstance(self.config.params.get("subagents"), list):
-                wanted = [str(n) for n in self.config.params.get("subagents")]
-
-            if wanted:
-                selected: list[tuple[str, type[Agent]]] = []
-                for name in wanted:
-                    if name == "MasterAgent":
-                        continue
-                    cls = AGENT_REGISTRY.get(name)
-                    if cls is not None:
-                        selected.append((name, cls))
-                # If none valid, fall back to default selection
-                if not selected:
-                    sub = {n: c for n, c in AGENT_REGISTRY.items() if n != "MasterAgent"}
-                    selected = list(sub.items())[:2]
-                    logging.debug(
-                        "[master] requested subagents unavailable, fallback selection=%s",
-                        [n for n, _ in selected],
-                    )
-            else:
-                # Default selection (deterministic subset)
-                sub = {n: c for n, c in AGENT_REGISTRY.items() if n != "MasterAgent"}
-                selected = list(sub.items())[:2]
-                logging.debug("[master] default subagent selection=%s", [n for n, _ in selected])
-            # Apply allowlist filter
-            allowed_names = policy.filter_subagents([n for n, _ in selected])
-            selected = [(n, c) for (n, c) in selected if n in allowed_names]
             if not selected:
-                logging.debug(
-                    "[master] no subagents allowed after policy filter (requested=%s, allowed=%s)",
-                    [n for n, _ in selected],
-                    allowed_names,
-                )
                 return {"results": {}, "metrics": {"latency": {}, "success": {}}}
             logging.debug("[master] executing subagents=%s", [n for n, _ in selected])
             tasks = [asyncio.create_task(_run_one(n, c)) for n, c in selected]
@@ -130,11 +144,23 @@ class MasterAgent(Agent):
             timeout_s,
             policy.max_rounds,
         )
-        last_results: Dict[str, Any] = {}
-        for idx in range(rounds):
-            logging.debug("[master] starting round %s/%s", idx + 1, rounds)
-            last_results = asyncio.run(_run_round_once())
-        forum.post("agent", "Synthesis complete", agent="MasterAgent")
+
+        async def _run_all_rounds() -> Dict[str, Any]:
+            # One loop for every round; rounds stay sequential because each posts to
+            # the shared forum transcript.
+            last: Dict[str, Any] = {}
+            for idx in range(rounds):
+                logging.debug("[master] starting round %s/%s", idx + 1, rounds)
+                last = await _run_round_once()
+            return last
+
+        # Bounded worker pool shared by all rounds for blocking sub-agents
+        pool = ThreadPoolExecutor(max_workers=min(8, len(selected) or 1), thread_name_prefix="subagent")
+        try:
+            last_results = asyncio.run(_run_all_rounds())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        forum.post_trusted("agent", "Synthesis complete", agent="MasterAgent")
         final_payload = {"rounds": rounds, **last_results, "transcript": forum.to_dict()}
         logging.debug(
             "[master] run finished (rounds=%s, result_keys=%s)",
@@ -142,3 +168,42 @@ class MasterAgent(Agent):
             list(last_results.get("results", {}).keys()),
         )
         return final_payload
+
+    def _resolve_selection(self, policy: SecurityPolicy) -> tuple[tuple[str, type[Agent]], ...]:
+        """Pick the sub-agents to run (requested or default) and apply the policy allow-list."""
+        wanted = []
+        if self.config.params and isinstance(self.config.params.get("subagents"), list):
+            wanted = [str(n) for n in self.config.params.get("subagents")]
+
+        if wanted:
+            selected: list[tuple[str, type[Agent]]] = []
+            for name in wanted:
+                if name == "MasterAgent":
+                    continue
+                cls = AGENT_REGISTRY.get(name)
+                if cls is not None:
+                    selected.append((name, cls))
+            # If none valid, fall back to default selection
+            if not selected:
+                sub = {n: c for n, c in AGENT_REGISTRY.items() if n != "MasterAgent"}
+                selected = list(sub.items())[:2]
+                logging.debug(
+                    "[master] requested subagents unavailable, fallback selection=%s",
+                    [n for n, _ in selected],
+                )
+        else:
+            # Default selection (deterministic subset)
+            sub = {n: c for n, c in AGENT_REGISTRY.items() if n != "MasterAgent"}
+            selected = list(sub.items())[:2]
+            logging.debug("[master] default subagent selection=%s", [n for n, _ in selected])
+        # Apply allowlist filter
+        requested = [n for n, _ in selected]
+        allowed_names = frozenset(policy.filter_subagents(requested))
+        allowed = tuple((n, c) for (n, c) in selected if n in allowed_names)
+        if not allowed:
+            logging.debug(
+                "[master] no subagents allowed after policy filter (requested=%s, allowed=%s)",
+                requested,
+                sorted(allowed_names),
+            )
+        return allowed
@@ -1,3 +1,4 @@
+import asyncio
 import time
 from typing import Any
 
@@ -11,7 +12,18 @@ class SlowAgent(Agent):
         """Store configuration for compatibility with the Agent API."""
         super().__init__(config)
 
+    @property
+    def duration(self) -> float:
+        """Seconds to sleep (``params.duration``, default 1.0)."""
+        params = self.config.params or {}
+        return float(params.get("duration", 1.0))
+
     def run(self, **kwargs: Any) -> Any:
-        """Sleep for a fixed duration and return a status string."""
-        time.sleep(1.0)
+        """Sleep for the configured duration and return a status string."""
+        time.sleep(self.duration)
+        return "slow"
+
+    async def arun(self, **kwargs: Any) -> Any:
+        """Sleep cooperatively on the event loop, without occupying a thread."""
+        await asyncio.sleep(self.duration)
         return "slow"
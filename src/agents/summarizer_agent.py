@@ -1,7 +1,7 @@
 """Summarizer Agent for multi-source synthesis and report generation."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, List, Tuple
 from .base import Agent, AgentConfig
 
 
@@ -13,6 +13,13 @@ class SummarizerAgent(Agent):
     conclusions, and maintains source attribution for traceability.
     """
 
+    # (context keyword, conclusion) in priority order
+    _CONTEXT_CONCLUSIONS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("technical", "Technical analysis demonstrates systematic understanding of implementation details."),
+        ("business", "Business analysis provides actionable insights for strategic decision-making."),
+        ("research", "Research synthesis contributes to knowledge accumulation in the field."),
+    )
+
     def __init__(self, config: AgentConfig):
         """
         Initialize the Summarizer Agent.
@@ -22,7 +29,7 @@ class SummarizerAgent(Agent):
                    Supports params: style (str), max_length (int).
         """
         super().__init__(config)
-        logging.debug(f"SummarizerAgent initialized with config: {config.name}")
+        logging.debug("SummarizerAgent initialized with config: %s", config.name)
 
     def run(self, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -62,8 +69,8 @@ class SummarizerAgent(Agent):
             style = self.config.params.get("style", "concise")
             max_length = self.config.params.get("max_length", 500)
         
-        logging.info(f"[Summarizer] Starting synthesis: {len(inputs)} sources, style={style}")
-        logging.debug(f"[Summarizer] Topic: {topic}, max_length: {max_length}")
+        logging.info("[Summarizer] Starting synthesis: %d sources, style=%s", len(inputs), style)
+        logging.debug("[Summarizer] Topic: %s, max_length: %s", topic, max_length)
         
         # Perform synthesis
         key_points = self._extract_key_points(inputs, style)
@@ -81,7 +88,7 @@ class SummarizerAgent(Agent):
             "style": style,
         }
         
-        logging.info(f"[Summarizer] Synthesis complete: {len(key_points)} key points, {word_count} words")
+        logging.info("[Summarizer] Synthesis complete: %d key points, %d words", len(key_points), word_count)
         return result
 
     def _extract_key_points(self, inputs: List[Any], style: str) -> List[str]:
@@ -102,23 +109,22 @@ class SummarizerAgent(Agent):
         
         for i, source in enumerate(inputs, 1):
             # Convert to string if needed
-            source_text = str(source)
+            source_text = source if isinstance(source, str) else str(source)
             
-            # Extract first sentence or main idea
-            sentences = source_text.split(".")
-            if sentences:
-                main_idea = sentences[0].strip()
-                if len(main_idea) > 10:
-                    key_points.append(f"Source {i}: {main_idea}")
-        
-        # Limit to desired point count
-        key_points = key_points[:point_count]
+            # Extract first sentence or main idea; partition stops at the first
+            # period instead of splitting the whole text into sentences
+            main_idea = source_text.partition(".")[0].strip()
+            if len(main_idea) > 10:
+                key_points.append(f"Source {i}: {main_idea}")
+                # Limit to desired point count; later sources could not contribute
+                if len(key_points) == point_count:
+                    break
         
         # Add synthesis-level observations
         if len(inputs) > 1:
             key_points.append(f"Synthesis across {len(inputs)} sources reveals common themes")
         
-        logging.debug(f"[Summarizer] Extracted {len(key_points)} key points")
+        logging.debug("[Summarizer] Extracted %d key points", len(key_points))
         return key_points
 
     def _synthesize_summary(self, inputs: List[Any], key_points: List[str], 
@@ -169,7 +175,7 @@ class SummarizerAgent(Agent):
         if len(summary) > max_length:
             summary = summary[:max_length] + "..."
         
-        logging.debug(f"[Summarizer] Synthesized summary: {len(summary)} chars")
+        logging.debug("[Summarizer] Synthesized summary: %d chars", len(summary))
         return summary
 
     def _generate_conclusions(self, key_points: List[str], context: str = "") -> List[str]:
@@ -191,21 +197,28 @@ class SummarizerAgent(Agent):
                 f"The analysis of {len(key_points)} key points reveals a comprehensive understanding of the subject."
             )
         
-        # Generate content-based conclusions
-        if any("source" in point.lower() for point in key_points):
+        # Generate content-based conclusions (one lower() per point, stop once both found)
+        has_source = has_common = False
+        for point in key_points:
+            lowered = point.lower()
+            has_source = has_source or "source" in lowered
+            has_common = has_common or "common" in lowered
+            if has_source and has_common:
+                break
+        
+        if has_source:
             conclusions.append("Multi-source synthesis provides robust validation of findings.")
         
-        if any("common" in point.lower() for point in key_points):
+        if has_common:
             conclusions.append("Common themes across sources indicate consistent patterns.")
         
-        # Add context-specific conclusions
+        # Add context-specific conclusions (first matching keyword wins)
         if context:
-            if "technical" in context.lower():
-                conclusions.append("Technical analysis demonstrates systematic understanding of implementation details.")
-            elif "business" in context.lower():
-                conclusions.append("Business analysis provides actionable insights for strategic decision-making.")
-            elif "research" in context.lower():
-                conclusions.append("Research synthesis contributes to knowledge accumulation in the field.")
+            lowered = context.lower()
+            for keyword, conclusion in self._CONTEXT_CONCLUSIONS:
+                if keyword in lowered:
+                    conclusions.append(conclusion)
+                    break
         
         # Add general closing conclusion
         if len(conclusions) == 0:
@@ -213,7 +226,7 @@ class SummarizerAgent(Agent):
         
         conclusions.append("Recommendations for further investigation are provided in the detailed analysis.")
         
-        logging.debug(f"[Summarizer] Generated {len(conclusions)} conclusions")
+        logging.debug("[Summarizer] Generated %d conclusions", len(conclusions))
         return conclusions
 
     def _validate_inputs(self, inputs: List[Any]) -> bool:
@@ -1,23 +1,46 @@
-from typing import List, Optional
+import sys
+from collections import deque
+from typing import Deque, List, Optional
+
+from pydantic import TypeAdapter
 
 from agents.base import Message
 
+# Serializes a whole transcript in one pydantic-core call
+_TRANSCRIPT_ADAPTER = TypeAdapter(List[Message])
+
 
 class Forum:
     """
     In-memory forum for orchestration transcripts.
     """
 
-    def __init__(self) -> None:
-        """Initialise an empty transcript container."""
-        self._messages: List[Message] = []
+    def __init__(self, max_messages: Optional[int] = None) -> None:
+        """Initialise an empty transcript, optionally keeping only the newest ``max_messages``."""
+        self._messages: Deque[Message] = deque(maxlen=max_messages)
 
     def post(self, role: str, content: str, agent: Optional[str] = None) -> Message:
-        """Append a message to the transcript and return its Pydantic model."""
+        """Validate and append a message to the transcript, returning its Pydantic model."""
         msg = Message(role=role, agent=agent, content=content)
         self._messages.append(msg)
         return msg
 
+    def post_trusted(self, role: str, content: str, agent: Optional[str] = None) -> Message:
+        """Append a message without per-field validation.
+
+        For orchestrators that choose ``role`` and ``agent`` themselves (fixed roles,
+        registered agent names); when either comes from outside input, use ``post``.
+        """
+        # Roles and agent names come from a small vocabulary, so interning lets every
+        # message share one copy.
+        msg = Message.from_trusted(
+            role=sys.intern(role),
+            agent=sys.intern(agent) if agent else agent,
+            content=content,
+        )
+        self._messages.append(msg)
+        return msg
+
     def messages(self) -> List[Message]:
         """Return a shallow copy of accumulated messages."""
         return list(self._messages)
@@ -25,4 +48,8 @@ class Forum:
     def to_dict(self) -> List[dict]:
         """Serialise messages to JSON-friendly dictionaries."""
         # JSON-friendly dicts (e.g., datetime -> ISO string)
-        return [m.model_dump(mode="json") for m in self._messages]
+        return _TRANSCRIPT_ADAPTER.dump_python(list(self._messages), mode="json")
+
+    def to_json_bytes(self) -> bytes:
+        """Serialise messages straight to JSON bytes, without intermediate dicts."""
+        return _TRANSCRIPT_ADAPTER.dump_json(list(self._messages))
@@ -8,7 +8,29 @@ function. Default language is English, with optional Polish strings.
 
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=128)
+def _parse(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Split a template into (literal, field name) pairs, parsed once per template.
+
+    Returns None when the template needs the full format machinery (format specs,
+    conversions, attribute/index access, positional fields) or is malformed.
+    """
+    try:
+        parsed = tuple(Formatter().parse(template))
+    except ValueError:
+        return None
+    tokens = []
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        tokens.append((literal, field))
+    return tuple(tokens)
 
 
 class I18N:
@@ -55,8 +77,16 @@ class I18N:
         """Translate the message template for the current language."""
         bundle = cls._messages.get(key, {})
         template = bundle.get(cls._lang) or bundle.get("en") or key
+        tokens = _parse(template)
         try:
-            return template.format(**kwargs)
+            if tokens is None:
+                return template.format(**kwargs)
+            parts = []
+            for literal, field in tokens:
+                parts.append(literal)
+                if field is not None:
+                    parts.append(format(kwargs[field]))
+            return "".join(parts)
         except Exception:
             return template
 
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any, Dict
 
-try:
-    from pydantic import BaseModel
-except Exception:  # pragma: no cover
-    BaseModel = None  # type: ignore[assignment]
+# Sample value types. Exact types are matched first; subclasses (e.g. NumPy scalars)
+# still count, except bool, which would be rendered as True/False.
+_NUMERIC_TYPES = (int, float)
+
+
+def _is_sample(value: Any) -> bool:
+    """Return True when ``value`` can be written as a sample value."""
+    cls = type(value)
+    return cls in _NUMERIC_TYPES or (cls is not bool and isinstance(value, _NUMERIC_TYPES))
+
+
+def _is_pydantic_model(value: Any) -> bool:
+    """Return True for pydantic models, without importing pydantic for anything else."""
+    # A model instance implies pydantic is already imported
+    pydantic = sys.modules.get("pydantic")
+    return pydantic is not None and isinstance(value, pydantic.BaseModel)
 
 
 class PrometheusExporter:
@@ -37,7 +50,7 @@ class PrometheusExporter:
         payload: Dict[str, Any] = {}
         if isinstance(result, dict):
             payload = result
-        elif BaseModel is not None and isinstance(result, BaseModel):  # type: ignore[arg-type]
+        elif _is_pydantic_model(result):
             payload = result.model_dump()
         elif hasattr(result, "dict"):  # fallback for other libraries
             try:
@@ -45,38 +58,45 @@ class PrometheusExporter:
             except Exception:  # pragma: no cover
                 payload = {}
 
-        lines: list[str] = []
-        lines.append("# HELP ftsystem_run_duration_seconds Agent execution duration.")
-        lines.append("# TYPE ftsystem_run_duration_seconds gauge")
-        lines.append(f'ftsystem_run_duration_seconds{{agent="{agent}"}} {duration:.6f}')
-
-        rounds = payload.get("rounds")
-        if isinstance(rounds, (int, float)):
-            lines.append("# HELP ftsystem_rounds_total Number of orchestration rounds.")
-            lines.append("# TYPE ftsystem_rounds_total gauge")
-            lines.append(f'ftsystem_rounds_total{{agent="{agent}"}} {rounds}')
-
-        metrics = payload.get("metrics") if isinstance(payload, dict) else None
-        if isinstance(metrics, dict):
-            latency = metrics.get("latency")
-            if isinstance(latency, dict):
-                lines.append("# HELP ftsystem_subagent_latency_seconds Sub-agent latency in seconds.")
-                lines.append("# TYPE ftsystem_subagent_latency_seconds gauge")
-                for subagent, value in latency.items():
-                    if isinstance(value, (int, float)):
-                        lines.append(
-                            f'ftsystem_subagent_latency_seconds{{agent="{agent}",subagent="{subagent}"}} {value}'
-                        )
-            success = metrics.get("success")
-            if isinstance(success, dict):
-                lines.append("# HELP ftsystem_subagent_success_total Sub-agent success flag (1 successful, 0 otherwise).")
-                lines.append("# TYPE ftsystem_subagent_success_total gauge")
-                for subagent, value in success.items():
-                    if isinstance(value, (int, float)):
-                        lines.append(
-                            f'ftsystem_subagent_success_total{{agent="{agent}",subagent="{subagent}"}} {value}'
-                        )
+        # Lines go straight to the file (through its write buffer) instead of being
+        # collected in a list and joined.
+        with path.open("w", encoding="utf-8") as f:
+            write = f.write
+            write(
+                "# HELP ftsystem_run_duration_seconds Agent execution duration.\n"
+                "# TYPE ftsystem_run_duration_seconds gauge\n"
+                f'ftsystem_run_duration_seconds{{agent="{agent}"}} {duration:.6f}\n'
+            )
 
-        lines.append("")  # ensure trailing newline
-        path.write_text("\n".join(lines), encoding="utf-8")
+            rounds = payload.get("rounds")
+            if _is_sample(rounds):
+                write(
+                    "# HELP ftsystem_rounds_total Number of orchestration rounds.\n"
+                    "# TYPE ftsystem_rounds_total gauge\n"
+                    f'ftsystem_rounds_total{{agent="{agent}"}} {rounds}\n'
+                )
 
+            metrics = payload.get("metrics") if isinstance(payload, dict) else None
+            if isinstance(metrics, dict):
+                # Families without samples are left out entirely (no bare HELP/TYPE
+                # headers). Each family stays contiguous, as the exposition format requires.
+                latency = metrics.get("latency")
+                if isinstance(latency, dict):
+                    samples = [(sub, v) for sub, v in latency.items() if _is_sample(v)]
+                    if samples:
+                        write(
+                            "# HELP ftsystem_subagent_latency_seconds Sub-agent latency in seconds.\n"
+                            "# TYPE ftsystem_subagent_latency_seconds gauge\n"
+                        )
+                        for subagent, value in samples:
+                            write(f'ftsystem_subagent_latency_seconds{{agent="{agent}",subagent="{subagent}"}} {value}\n')
+                success = metrics.get("success")
+                if isinstance(success, dict):
+                    samples = [(sub, v) for sub, v in success.items() if _is_sample(v)]
+                    if samples:
+                        write(
+                            "# HELP ftsystem_subagent_success_total Sub-agent success flag (1 successful, 0 otherwise).\n"
+                            "# TYPE ftsystem_subagent_success_total gauge\n"
+                        )
+                        for subagent, value in samples:
+                            write(f'ftsystem_subagent_success_total{{agent="{agent}",subagent="{subagent}"}} {value}\n')
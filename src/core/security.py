@@ -1,6 +1,6 @@
 import os
 import re
-from typing import Iterable, List, Optional
+from typing import IO, Iterable, List, Optional
 
 
 class SecurityPolicy:
@@ -11,7 +11,7 @@ class SecurityPolicy:
 
     def __init__(self, allowed_agents: Optional[Iterable[str]] = None, max_rounds: int = 5) -> None:
         """Create a policy with optional allow-list and rounds cap."""
-        self.allowed = set(a for a in (allowed_agents or [])) or None
+        self.allowed = frozenset(allowed_agents or ()) or None
         self.max_rounds = max(1, int(max_rounds))
 
     @classmethod
@@ -28,6 +28,9 @@ class SecurityPolicy:
         """Restrict the provided agent list based on the allow-list."""
         if self.allowed is None:
             return names
+        if self.allowed.issuperset(names):
+            # Nothing to drop: copy in C rather than testing names one by one
+            return list(names)
         return [n for n in names if n in self.allowed]
 
     def cap_rounds(self, rounds: int) -> int:
@@ -39,6 +42,38 @@ class SecurityPolicy:
         return max(1, min(r, self.max_rounds))
 
 
+class _RunStartPattern:
+    """
+    A regex whose match must begin with a run of ``head`` characters, searched in
+    linear time. If an attempt fails just after a ``head`` character, the attempt
+    one position earlier (same run, one character longer) already failed too, so
+    only run starts and the end of the previous match need trying. Plain ``re``
+    would rescan the rest of the run from every position (quadratic on long
+    tokens). Results are identical to ``re.compile(pattern).sub``.
+    """
+
+    __slots__ = ("_anchored", "_guarded")
+
+    def __init__(self, pattern: str, head: str) -> None:
+        self._anchored = re.compile(pattern)
+        self._guarded = re.compile(rf"(?<!{head}){pattern}")
+
+    def sub(self, repl: str, text: str) -> str:
+        """Replace every match in ``text`` (same semantics as ``re.Pattern.sub``)."""
+        parts: List[str] = []
+        pos = 0
+        while pos < len(text):
+            m = self._anchored.match(text, pos) or self._guarded.search(text, pos + 1)
+            if m is None:
+                break
+            parts += (text[pos : m.start()], m.expand(repl))
+            pos = m.end()
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return "".join(parts)
+
+
 class Redactor:
     """
     Redact sensitive patterns from text for logs/history.
@@ -50,34 +85,59 @@ class Redactor:
 
     _level: str = "normal"
 
+    # Each pattern carries the substrings it needs in order to match (any one of
+    # them): () means it always runs, _DIGIT that it needs a decimal digit.
+    # Patterns stay sequential substitutions: a fused alternation lets a greedy match
+    # (e.g. an email ending in "...orgsk") swallow the start of a later secret.
+    _DIGIT = None
+    _digit_re = re.compile(r"\d")
+
     # Base (normal) patterns
     _base_patterns = [
         # OpenAI-style keys: sk-XXXXX...
-        (re.compile(r"sk-[A-Za-z0-9]{8,}"), "sk-<redacted>"),
+        (re.compile(r"sk-[A-Za-z0-9]{8,}"), "sk-<redacted>", ("sk-",)),
         # Email addresses
-        (re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"), "<redacted-email>"),
+        (_RunStartPattern(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", r"[A-Za-z0-9._%+-]"), "<redacted-email>", ("@",)),
     ]
 
     # Strict-only patterns (applied in addition to base)
     _strict_patterns = [
         # Bearer tokens
-        (re.compile(r"(?i)\bBearer\s+[A-Za-z0-9._\-]{10,}\b"), "Bearer <redacted-token>"),
+        (re.compile(r"(?i)\bBearer\s+[A-Za-z0-9._\-]{10,}\b"), "Bearer <redacted-token>", ()),
         # AWS Access Key ID
-        (re.compile(r"\bAKIA[0-9A-Z]{16}\b"), "<redacted-aws-key>"),
+        (re.compile(r"\bAKIA[0-9A-Z]{16}\b"), "<redacted-aws-key>", ("AKIA",)),
         # IPv4 addresses
-        (re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"), "<redacted-ip>"),
+        (re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"), "<redacted-ip>", _DIGIT),
         # Long numeric sequences (credit cards etc.) allowing spaces/dashes between digits
-        (re.compile(r"\b(?:\d[ \-]?){13,19}\b"), "<redacted-number>"),
+        (re.compile(r"\b(?:\d[ \-]?){13,19}\b"), "<redacted-number>", _DIGIT),
         # Generic secrets: api/secret/token/password=value (but skip 'Bearer ...')
-        (re.compile(r"(?i)(api|secret|token|password)[=:]\s*(?!Bearer\b)([^\s,;]{6,})"), r"\1=<redacted>"),
+        (re.compile(r"(?i)(api|secret|token|password)[=:]\s*(?!Bearer\b)([^\s,;]{6,})"), r"\1=<redacted>", ("=", ":")),
         # Polish IBAN (PL + 26 digits)
-        (re.compile(r"\bPL\d{26}\b"), "<redacted-iban>"),
+        (re.compile(r"\bPL\d{26}\b"), "<redacted-iban>", ("PL",)),
         # Polish PESEL (11 digits)
-        (re.compile(r"\b\d{11}\b"), "<redacted-pesel>"),
+        (re.compile(r"\b\d{11}\b"), "<redacted-pesel>", _DIGIT),
         # Polish NIP (10 digits, with optional separators) or EU VAT 'PL'+10 digits
-        (re.compile(r"\b(?:\d{3}[- ]?\d{3}[- ]?\d{2}[- ]?\d{2}|PL\d{10})\b", re.IGNORECASE), "<redacted-nip>"),
+        (re.compile(r"\b(?:\d{3}[- ]?\d{3}[- ]?\d{2}[- ]?\d{2}|PL\d{10})\b", re.IGNORECASE), "<redacted-nip>", _DIGIT),
     ]
 
+    # Full pattern sequence per level, assembled once at import
+    _level_patterns = {
+        "normal": tuple(_base_patterns),
+        "strict": tuple(_base_patterns + _strict_patterns),
+    }
+
+    # Prescreen per level: (literal substrings, case-insensitive keyword search, needs-digit
+    # flag). Every pattern of the level needs one of them in order to match, so text
+    # with none is returned unchanged after a few searches. Keywords are searched with
+    # re's own IGNORECASE matching, the same folding the (?i) patterns use ("ı" matches
+    # "i", "ſ" matches "s", the Kelvin sign matches "k"); casefold() misses some of these.
+    _level_prescreen = {
+        "normal": (("sk-", "@"), None, False),
+        "strict": (("sk-", "@", "AKIA"), re.compile(r"bearer|api|secret|token|password", re.I).search, True),
+    }
+    # A line ending in "Bearer" (any case) continues into the next one
+    _bearer_end = re.compile(r"bearer\Z", re.I)
+
     @classmethod
     def set_level(cls, level: str) -> None:
         """Persist the desired redaction level (normal or strict)."""
@@ -97,9 +157,44 @@ class Redactor:
         if text is None:
             return None
         out = str(text)
-        patterns = list(cls._base_patterns)
-        if cls._level == "strict":
-            patterns.extend(cls._strict_patterns)
-        for pat, repl in patterns:
+        if not out:
+            return out
+        literals, keywords, digits = cls._level_prescreen[cls._level]
+        has_digit = None
+        if not any(a in out for a in literals):
+            if digits:
+                has_digit = cls._digit_re.search(out) is not None
+            if not has_digit and (keywords is None or keywords(out) is None):
+                return out
+        for pat, repl, anchors in cls._level_patterns[cls._level]:
+            # No replacement adds a digit or a later pattern's anchor, so the checks stay sound
+            # as the text is rewritten.
+            if anchors is cls._DIGIT:
+                if has_digit is None:
+                    has_digit = cls._digit_re.search(out) is not None
+                if not has_digit:
+                    continue
+            elif anchors and not any(a in out for a in anchors):
+                continue
             out = pat.sub(repl, out)
         return out
+
+    @classmethod
+    def redact_stream(cls, src: Iterable[str], dst: IO[str]) -> None:
+        """
+        Redact text line by line from ``src`` into ``dst`` without holding it all.
+
+        The output equals ``redact`` on the whole text. Only the whitespace after
+        "Bearer" or after a secret's "="/":" can match a line break, so a line ending
+        that way is joined with the next one before redacting.
+        """
+        pending = ""
+        for line in src:
+            pending += line
+            tail = pending.rstrip()
+            if tail.endswith(("=", ":")) or cls._bearer_end.match(tail, max(0, len(tail) - 6)):
+                continue
+            dst.write(cls.redact(pending) or "")
+            pending = ""
+        if pending:
+            dst.write(cls.redact(pending) or "")
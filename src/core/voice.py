@@ -1,10 +1,41 @@
 from __future__ import annotations
 
+import json
+import logging
+import math
 import queue
+import threading
 from dataclasses import dataclass
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, ClassVar, Dict, List, Optional, Sequence
+
+# Energy-based voice activity detection on int16 RMS levels
+_VAD_CALIBRATION_SEC = 0.2  # leading audio used to estimate the noise floor
+_VAD_NOISE_RATIO = 3.0  # speech must be this many times louder than the noise floor
+_VAD_MIN_RMS = 300.0  # absolute minimum, so near-digital silence never counts as speech
+# Absolute maximum: a "noise floor" this loud means the user spoke during calibration,
+# and the threshold must stay low enough for normal speech to register
+_VAD_MAX_RMS = 1000.0
+_FINAL_TAIL_SEC = 0.3  # silence after a recognized segment that ends the utterance
+
+
+def _rms_int16(data: bytes) -> float:
+    """Return the RMS level of a block of native-endian int16 mono samples."""
+    samples = memoryview(data).cast("h")
+    if not samples:
+        return 0.0
+    # hypot computes the root of the sum of squares in one C loop (~3x faster than
+    # summing map(operator.mul, ...) over a 100ms block)
+    return math.hypot(*samples) / math.sqrt(len(samples))
+
+
+def _result_text(raw: str) -> str:
+    """Return the recognized text of a Vosk JSON result, stripped ("" when there is none)."""
+    if '"text" : ""' in raw:
+        # Vosk reports every silent segment; skip building a dict for those
+        return ""
+    return (json.loads(raw).get("text") or "").strip()
 
 
 @dataclass
@@ -16,6 +47,7 @@ class STTConfig:
     device_index: Optional[int] = None
     beep: bool = True
     silence_timeout_sec: Optional[float] = None  # if set, stop after this many seconds of silence
+    stop_on_final_text: bool = False  # opt-in: stop once a recognized segment is followed by a short silence
 
 
 class VoskSTT:
@@ -23,23 +55,86 @@ class VoskSTT:
     Offline STT using Vosk engine. Imports heavy deps lazily.
     """
 
+    # Loaded models by directory, shared by every instance (a load takes seconds)
+    _models: ClassVar[Dict[str, Any]] = {}
+    # Batch models by directory; None marks a Vosk build without batch support
+    _batch_models: ClassVar[Dict[str, Any]] = {}
+    _models_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Bytes handed to a recognizer per call when transcribing recorded audio
+    _FEED_BYTES: ClassVar[int] = 16000
+
     def __init__(self, cfg: STTConfig) -> None:
-        """Store configuration used for subsequent recordings."""
+        """Store configuration and start loading Vosk in the background."""
         self.cfg = cfg
+        self._preload_error: Optional[BaseException] = None
+        # Overlap the slow imports and model load with the user getting ready to speak
+        self._preload = threading.Thread(target=self._warm_up, name="vosk-preload", daemon=True)
+        self._preload.start()
+
+    def _warm_up(self) -> None:
+        """Import Vosk and load the model; a failure is kept and re-raised on first use."""
+        try:
+            self._ensure(mic=False)
+            self._get_model(self._model_path())
+        except Exception as e:
+            logging.debug("Vosk preload failed for %s: %s", self.cfg.model_dir, e, exc_info=e)
+            self._preload_error = e
 
-    def _ensure(self) -> None:
-        """Verify that required STT dependencies are available."""
+    def _await_preload(self) -> None:
+        """Wait for the background load and re-raise the error it hit, if any."""
+        self._preload.join()
+        if self._preload_error is not None:
+            raise self._preload_error
+
+    def _ensure(self, mic: bool = True) -> None:
+        """Verify that required STT dependencies are available (sounddevice only for ``mic``)."""
         try:
             import vosk  # type: ignore
         except Exception as e:
             raise RuntimeError(
                 f"Vosk is not available. Install 'vosk' and download a PL model. Error: {e}"
             )
+        if not mic:
+            return
         try:
             import sounddevice  # type: ignore # noqa: F401
         except Exception as e:
             raise RuntimeError(f"sounddevice is required for STT. Error: {e}")
 
+    @classmethod
+    def _get_model(cls, model_path: str) -> Any:
+        """Return the Vosk model for ``model_path``, loading it once per process."""
+        import vosk  # type: ignore
+
+        with cls._models_lock:
+            model = cls._models.get(model_path)
+            if model is None:
+                model = cls._models[model_path] = vosk.Model(model_path)
+        return model
+
+    @classmethod
+    def _get_batch_model(cls, model_path: str) -> Any:
+        """Return the Vosk BatchModel for ``model_path``, or None if this build lacks one."""
+        import vosk  # type: ignore
+
+        with cls._models_lock:
+            if model_path not in cls._batch_models:
+                try:
+                    cls._batch_models[model_path] = vosk.BatchModel(model_path)
+                except AttributeError:
+                    # Batch decoding is only compiled into GPU-enabled Vosk builds
+                    cls._batch_models[model_path] = None
+            return cls._batch_models[model_path]
+
+    def _model_path(self) -> str:
+        """Return the configured model directory, failing early when it is missing."""
+        model_path = str(self.cfg.model_dir)
+        if not Path(model_path).exists():
+            raise RuntimeError(
+                f"Vosk model directory not found: {model_path}. Set --stt-model-dir or FTSYSTEM_VOSK_MODEL."
+            )
+        return model_path
+
     @staticmethod
     def _beep() -> None:
         """Best-effort short beep without extra deps."""
@@ -62,34 +157,52 @@ class VoskSTT:
         """Record up to max_seconds from mic and return recognized text (may be empty).
 
         If `silence_timeout_sec` is set, recording will stop early after that many seconds
-        of (approximate) silence. Uses Vosk partial results as a crude VAD signal.
+        of silence. With `stop_on_final_text` it also stops ~300ms after Vosk finalizes a
+        segment with text, if no speech follows, which suits single commands rather than
+        dictation. Silence is detected from the signal energy: blocks quieter than a
+        multiple of the noise floor (measured over the first ~200ms, and capped so speech
+        during that window still registers) count as silent.
         """
+        self._await_preload()
         self._ensure()
         import sounddevice as sd  # type: ignore
         import vosk  # type: ignore
-        import json
 
-        model_path = str(self.cfg.model_dir)
-        if not Path(model_path).exists():
-            raise RuntimeError(
-                f"Vosk model directory not found: {model_path}. Set --stt-model-dir or FTSYSTEM_VOSK_MODEL."
-            )
-
-        model = vosk.Model(model_path)
-        q: "queue.Queue[bytes]" = queue.Queue()
+        model = self._get_model(self._model_path())
+        # Durations are counted in bytes of int16 mono audio, so block lengths add up
+        # exactly whatever the blocksize (summing 0.1s floats drifts)
+        bytes_per_sec = 2 * self.cfg.samplerate
+        max_bytes = round(float(self.cfg.max_seconds) * bytes_per_sec)
+        # 100ms blocks, so silence is detected (and recording stops) at that resolution
+        blocksize = self.cfg.samplerate // 10
+        # The audio callback copies each block into this preallocated ring and queues
+        # only its (offset, length), so the real-time thread allocates no audio buffers.
+        # It holds the whole recording plus two blocks of slack, so nothing is
+        # overwritten before it is read.
+        ring = bytearray(max_bytes + 4 * blocksize)
+        ring_view = memoryview(ring)
+        write_at = 0
+        # Single producer (audio callback), single consumer: no need for Queue's locking
+        q: "queue.SimpleQueue[tuple[int, int]]" = queue.SimpleQueue()
 
         def callback(indata, frames, time, status):  # noqa: ANN001, ANN201
+            nonlocal write_at
             if status:
                 # non-fatal
                 pass
-            q.put(bytes(indata))
+            n = len(indata)
+            if write_at + n > len(ring):
+                write_at = 0
+            ring[write_at : write_at + n] = indata
+            q.put((write_at, n))
+            write_at += n
 
         if self.cfg.beep:
             self._beep()
         start_time = time.monotonic()
         with sd.RawInputStream(
             samplerate=self.cfg.samplerate,
-            blocksize=8000,
+            blocksize=blocksize,
             device=self.cfg.device_index,
             dtype="int16",
             channels=1,
@@ -97,48 +210,116 @@ class VoskSTT:
         ):
             rec = vosk.KaldiRecognizer(model, self.cfg.samplerate)
             text_parts = []
-            seconds = 0.0
-            silence_for = 0.0
             speech_started = False
-            # Rough estimate per q.get() block (depends on blocksize/samplerate)
-            est_block_sec = 0.5
-            while seconds < float(self.cfg.max_seconds):
-                data = q.get()
-                seconds += est_block_sec
-                if rec.AcceptWaveform(data):
-                    res = json.loads(rec.Result())
-                    if res.get("text"):
-                        text_parts.append(res["text"])
-                        speech_started = True
-                        silence_for = 0.0
-                else:
-                    # consider partial result as voice activity if non-empty
-                    try:
-                        pres = json.loads(rec.PartialResult())
-                        if pres.get("partial"):
+            silence_limit = None
+            if self.cfg.silence_timeout_sec is not None:
+                silence_limit = round(float(self.cfg.silence_timeout_sec) * bytes_per_sec)
+            calibration_bytes = round(_VAD_CALIBRATION_SEC * bytes_per_sec)
+            tail_bytes = round(_FINAL_TAIL_SEC * bytes_per_sec) if self.cfg.stop_on_final_text else None
+            received = 0
+            silent = 0
+            noise_bytes = 0
+            noise_energy = 0.0
+            threshold: Optional[float] = None  # set once the noise floor is calibrated
+            zero_copy = True
+            while received < max_bytes:
+                offset, size = q.get()
+                block = ring_view[offset : offset + size]
+                received += size
+                rms = _rms_int16(block)
+                if threshold is None:
+                    noise_bytes += size
+                    noise_energy += rms * size
+                    silent += size
+                    if noise_bytes >= calibration_bytes:
+                        noise_floor = noise_energy / noise_bytes
+                        threshold = min(_VAD_MAX_RMS, max(_VAD_MIN_RMS, _VAD_NOISE_RATIO * noise_floor))
+                        if noise_floor >= threshold:
+                            # The calibration window held speech, not noise
                             speech_started = True
-                            silence_for = 0.0
-                        else:
-                            silence_for += est_block_sec
-                    except Exception:
-                        silence_for += est_block_sec
+                            silent = 0
+                elif rms >= threshold:
+                    speech_started = True
+                    silent = 0
+                else:
+                    silent += size
+                # Hand Vosk the view into the ring directly; copy to bytes only if its
+                # binding rejects buffers (the TypeError comes before any audio is read)
+                try:
+                    segment_done = rec.AcceptWaveform(block if zero_copy else bytes(block))
+                except TypeError:
+                    if not zero_copy:
+                        raise
+                    zero_copy = False
+                    segment_done = rec.AcceptWaveform(bytes(block))
+                if segment_done:
+                    text = _result_text(rec.Result())
+                    if text:
+                        text_parts.append(text)
+                        speech_started = True
+                        silent = 0
                 # Optional early stop on silence once speech has started
-                if (
-                    speech_started
-                    and self.cfg.silence_timeout_sec is not None
-                    and silence_for >= float(self.cfg.silence_timeout_sec)
-                ):
+                if speech_started and silence_limit is not None and silent >= silence_limit:
+                    break
+                # End of utterance: Vosk closed a segment with text and the signal stayed quiet
+                if text_parts and tail_bytes is not None and silent >= tail_bytes:
                     break
-            final = rec.FinalResult()
             try:
-                res_final = json.loads(final)
-                if res_final.get("text"):
-                    text_parts.append(res_final["text"])
+                final_text = _result_text(rec.FinalResult())
+                if final_text:
+                    text_parts.append(final_text)
             except Exception:
                 pass
         if self.cfg.beep:
             self._beep()
-        return " ".join(tp.strip() for tp in text_parts if tp.strip())
+        return " ".join(text_parts)
+
+    def listen_batch(self, chunks: Sequence[bytes]) -> List[str]:
+        """Transcribe recorded utterances (raw int16 mono PCM at ``samplerate``), in order.
+
+        Uses Vosk's BatchModel when the installed build provides it, so all utterances
+        are decoded together; otherwise each one goes through a regular recognizer on
+        the cached model.
+        """
+        self._await_preload()
+        self._ensure(mic=False)
+        import vosk  # type: ignore
+
+        if not chunks:
+            return []
+        model_path = self._model_path()
+        step = self._FEED_BYTES
+        batch_model = self._get_batch_model(model_path)
+        results: List[List[str]] = []
+        if batch_model is None:
+            model = self._get_model(model_path)
+            for pcm in chunks:
+                rec = vosk.KaldiRecognizer(model, self.cfg.samplerate)
+                parts = [
+                    _result_text(rec.Result())
+                    for off in range(0, len(pcm), step)
+                    if rec.AcceptWaveform(pcm[off : off + step])
+                ]
+                parts.append(_result_text(rec.FinalResult()))
+                results.append(parts)
+        else:
+            recs = [vosk.BatchRecognizer(batch_model, self.cfg.samplerate) for _ in chunks]
+            for rec, pcm in zip(recs, chunks):
+                for off in range(0, len(pcm), step):
+                    rec.AcceptWaveform(pcm[off : off + step])
+                rec.FinishStream()
+            # Decoding happens on the batch model's worker; wait until every stream is done
+            batch_model.Wait()
+            while any(rec.GetPendingChunks() for rec in recs):
+                batch_model.Wait()
+            for rec in recs:
+                parts = []
+                raw = rec.Result()
+                while raw:
+                    parts.append(_result_text(raw))
+                    raw = rec.Result()
+                results.append(parts)
+        return [" ".join(filter(None, parts)) for parts in results]
 
 
 class SapiTTS:
@@ -146,29 +327,42 @@ class SapiTTS:
     TTS via pyttsx3 (SAPI5 on Windows). Imports lazily.
     """
 
+    # Initialised engines by language, shared by every instance
+    _engines: ClassVar[Dict[str, Any]] = {}
+
     def __init__(self, lang: str = "pl-PL") -> None:
-        """Initialise the engine and pick a best-effort matching voice."""
+        """Check that pyttsx3 is available; the engine itself starts on first use."""
         self.lang = lang
         try:
-            import pyttsx3  # type: ignore
+            import pyttsx3  # type: ignore # noqa: F401
         except Exception as e:
             raise RuntimeError(f"pyttsx3 not available for TTS. Install it. Error: {e}")
-        self.engine = pyttsx3.init()
-        # Try to select a voice matching language
-        try:
-            voices = self.engine.getProperty("voices")
-            for v in voices:
-                if self.lang.split("-")[0].lower() in (v.name or "").lower() or (
-                    v.languages and self.lang.encode() in v.languages
-                ):
-                    self.engine.setProperty("voice", v.id)
-                    break
-        except Exception:
-            pass
+
+    @property
+    def engine(self) -> Any:
+        """Return the engine for this language, initialising it and picking a voice once."""
+        engine = self._engines.get(self.lang)
+        if engine is None:
+            import pyttsx3  # type: ignore
+
+            engine = pyttsx3.init()
+            # Try to select a voice matching language
+            try:
+                prefix = self.lang.split("-")[0].lower()
+                lang_bytes = self.lang.encode()
+                for v in engine.getProperty("voices"):
+                    if prefix in (v.name or "").lower() or (v.languages and lang_bytes in v.languages):
+                        engine.setProperty("voice", v.id)
+                        break
+            except Exception:
+                pass
+            self._engines[self.lang] = engine
+        return engine
 
     def speak(self, text: str) -> None:
         """Vocalise the supplied text if it is non-empty."""
         if not text:
             return
-        self.engine.say(text)
-        self.engine.runAndWait()
+        engine = self.engine
+        engine.say(text)
+        engine.runAndWait()
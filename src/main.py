@@ -1,4 +1,6 @@
-import asyncio
+import bisect
+import functools
+import hashlib
 import inspect
 import json
 import logging
@@ -6,19 +8,27 @@ import os
 import re
 import sys
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, MutableMapping, Optional
 
 import typer
-from pydantic import BaseModel
 
-from agents import AGENT_REGISTRY, AGENT_IMPORT_ERRORS  # dynamiczny rejestr agentów
-from agents.base import AgentConfig, SessionSummary
 from core.i18n import I18N, t
 from core.metrics import PrometheusExporter
 from core.security import Redactor
 
+try:  # optional C codec for history scans and --output dumps; stdlib json otherwise
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if TYPE_CHECKING:
+    from agents.base import AgentConfig
+
 app = typer.Typer(help="ftSystem - Multi-Agent AI CLI")
 history_app = typer.Typer(help="Session history utilities")
 app.add_typer(history_app, name="history")
@@ -89,10 +99,33 @@ def _configure(
     logging.debug("ftsystem language set to %s", I18N.get_language())
 
 
+def _get_registry() -> MutableMapping[str, Any]:
+    """Return the agent registry, importing the agents package (and pydantic) on first use.
+
+    Kept out of module scope so ``--help`` and commands that never touch agents
+    start without paying for it.
+    """
+    from agents import AGENT_REGISTRY  # dynamiczny rejestr agentów
+
+    return AGENT_REGISTRY
+
+
 def complete_agent(incomplete: str) -> list[str]:
     """Return agent names that match the provided prefix (case-insensitive)."""
     text = (incomplete or "").lower()
-    return [name for name in AGENT_REGISTRY.keys() if name.lower().startswith(text)]
+    registry = _get_registry()
+    name_index = getattr(registry, "name_index", None)
+    if name_index is not None:
+        lowered, names = name_index()
+    else:
+        # Plain-mapping registries (e.g. swapped in by tests) have no cached index
+        pairs = sorted((name.lower(), name) for name in registry.keys())
+        lowered, names = [low for low, _ in pairs], [name for _, name in pairs]
+    # Names sharing the prefix sit next to each other in the sorted index
+    start = end = bisect.bisect_left(lowered, text)
+    while end < len(lowered) and lowered[end].startswith(text):
+        end += 1
+    return list(names[start:end])
 
 
 @app.command()
@@ -119,11 +152,12 @@ def run(
         output,
         tag,
     )
-    if agent not in AGENT_REGISTRY:
-        typer.echo(t("agent_not_found", agent=agent, available=list(AGENT_REGISTRY.keys())), err=True)
+    registry = _get_registry()
+    if agent not in registry:
+        typer.echo(t("agent_not_found", agent=agent, available=list(registry.keys())), err=True)
         raise typer.Exit(code=1)
 
-    agent_cls = AGENT_REGISTRY[agent]
+    agent_cls = registry[agent]
 
     # Build config (file -> env -> CLI params)
     try:
@@ -154,9 +188,21 @@ def run(
     if output is not None:
         try:
             # Support Pydantic models (v2)
+            from pydantic import BaseModel
+
             to_dump = result.model_dump() if isinstance(result, BaseModel) else result
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(to_dump, f, ensure_ascii=False, indent=2)
+            payload = None
+            if orjson is not None:
+                try:
+                    payload = orjson.dumps(to_dump, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                except TypeError:
+                    # e.g. integers beyond 64 bits: the stdlib encoder handles them or reports the error
+                    payload = None
+            if payload is not None:
+                output.write_bytes(payload)
+            else:
+                with open(output, "w", encoding="utf-8") as f:
+                    json.dump(to_dump, f, ensure_ascii=False, indent=2)
             typer.echo(f"Saved result JSON to: {output}")
         except TypeError as e:
             typer.echo(
@@ -180,29 +226,35 @@ def perf_profile(
     ),
     rounds: int = typer.Option(1, "--rounds", help="Rounds parameter when profiling MasterAgent"),
     repeat: int = typer.Option(3, "--repeat", help="Number of times to run the agent"),
+    concurrency: int = typer.Option(
+        1, "--concurrency", help="Run up to K repeats at once (for I/O-bound agents; 1 = sequential)"
+    ),
     json_out: bool = typer.Option(False, "--json", help="Return results as JSON"),
 ):
     """Profile execution time for the selected agent across multiple runs."""
-    if agent not in AGENT_REGISTRY:
-        typer.echo(t("agent_not_found", agent=agent, available=list(AGENT_REGISTRY.keys())), err=True)
+    from agents.base import AgentConfig
+
+    registry = _get_registry()
+    if agent not in registry:
+        typer.echo(t("agent_not_found", agent=agent, available=list(registry.keys())), err=True)
         raise typer.Exit(code=1)
     if repeat < 1:
         raise typer.BadParameter("--repeat must be >= 1")
-    agent_cls = AGENT_REGISTRY[agent]
+    if concurrency < 1:
+        raise typer.BadParameter("--concurrency must be >= 1")
+    agent_cls = registry[agent]
 
     chosen_subagents = subagent or []
     if agent == "MasterAgent" and not chosen_subagents:
-        chosen_subagents = [name for name in AGENT_REGISTRY.keys() if name != "MasterAgent"][:3]
+        chosen_subagents = [name for name in registry.keys() if name != "MasterAgent"][:3]
 
-    durations: list[float] = []
-    results: list[Any] = []
-    for idx in range(repeat):
+    def _new_agent(idx: int) -> Any:
         params: dict[str, Any] | None = None
         if agent == "MasterAgent":
             params = {"subagents": chosen_subagents, "rounds": rounds}
         elif chosen_subagents:
             params = {"subagents": chosen_subagents}
-        cfg = AgentConfig(
+        cfg = AgentConfig.from_trusted(
             name=f"{agent}-profile",
             description="Performance profiling run",
             params=params,
@@ -213,11 +265,22 @@ def perf_profile(
             agent,
             params,
         )
-        start = time.perf_counter()
-        res = agent_cls(cfg).run()
-        duration = time.perf_counter() - start
-        durations.append(duration)
-        results.append(res)
+        return agent_cls(cfg)
+
+    durations: list[float] = []
+    results: list[Any] = []
+    if concurrency > 1:
+        import asyncio
+
+        durations, results = asyncio.run(_profile_concurrently(_new_agent, repeat, concurrency))
+    else:
+        for idx in range(repeat):
+            instance = _new_agent(idx)
+            start = time.perf_counter()
+            res = instance.run()
+            duration = time.perf_counter() - start
+            durations.append(duration)
+            results.append(res)
 
     summary = {
         "agent": agent,
@@ -230,6 +293,8 @@ def perf_profile(
     if agent == "MasterAgent":
         summary["rounds"] = rounds
         summary["subagents"] = chosen_subagents
+    if concurrency > 1:
+        summary["concurrency"] = concurrency
 
     if json_out:
         typer.echo(json.dumps(summary, ensure_ascii=False, indent=2))
@@ -239,9 +304,31 @@ def perf_profile(
             typer.echo(f" Subagents: {chosen_subagents or '[]'}")
             typer.echo(f" Rounds: {rounds}")
         typer.echo(f" Runs: {repeat}")
+        if concurrency > 1:
+            typer.echo(f" Concurrency: {concurrency}")
         typer.echo(f" Avg duration: {summary['avg_duration']:.6f}s")
         typer.echo(f" Min duration: {summary['min_duration']:.6f}s")
         typer.echo(f" Max duration: {summary['max_duration']:.6f}s")
+
+
+async def _profile_concurrently(new_agent: Any, repeat: int, concurrency: int) -> tuple[list[float], list[Any]]:
+    """Run ``repeat`` fresh agents, at most ``concurrency`` at a time; return (durations, results) in run order."""
+    import asyncio
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _run_one(idx: int) -> tuple[float, Any]:
+        async with sem:
+            instance = new_agent(idx)
+            start = time.perf_counter()
+            # arun awaits natively async agents and runs blocking ones in the executor
+            res = await instance.arun()
+            return time.perf_counter() - start, res
+
+    runs = await asyncio.gather(*(_run_one(idx) for idx in range(repeat)))
+    return [duration for duration, _ in runs], [res for _, res in runs]
+
+
 @app.command("list-agents")
 def list_agents(
     verbose: bool = typer.Option(False, "--verbose", help="Show docstring and module path"),
@@ -252,9 +339,12 @@ def list_agents(
     fmt = (format or "text").lower()
     if fmt not in {"text", "json"}:
         raise typer.BadParameter("--format must be 'text' or 'json'")
+    from agents import AGENT_IMPORT_ERRORS
+
+    registry = _get_registry()
     if fmt == "json":
         agents = []
-        for name, cls in AGENT_REGISTRY.items():
+        for name, cls in registry.items():
             item = {"name": name}
             if verbose:
                 item["module"] = cls.__module__
@@ -269,7 +359,7 @@ def list_agents(
         return
     # text output
     typer.echo("Available agents:")
-    for name, cls in AGENT_REGISTRY.items():
+    for name, cls in registry.items():
         if verbose:
             doc = inspect.getdoc(cls) or ""
             module = cls.__module__
@@ -287,11 +377,33 @@ def list_agents(
             typer.echo("No import errors.")
 
 
+# Source of agents generated by new-agent; built once, filled in per call
+_AGENT_TEMPLATE = '''
+from .base import Agent, AgentConfig
+from typing import Any
+import logging
+
+
+class {class_name}(Agent):
+    """Example agent generated by CLI."""
+
+    def __init__(self, config: AgentConfig):
+        super().__init__(config)
+
+    def run(self, **kwargs: Any) -> Any:
+        logging.info("{class_name} is running")
+        return {{"message": "Hello from {class_name}"}}
+'''.lstrip()
+
+_RE_WS = re.compile(r"\W+")
+_RE_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+
+
 def _to_snake(name: str) -> str:
     """Convert a class-style name into snake_case for filenames."""
     name = name.strip()
-    name = re.sub(r"\W+", " ", name)
-    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = _RE_WS.sub(" ", name)
+    name = _RE_CAMEL.sub(r"\1_\2", name)
     return "_".join(part.lower() for part in name.split())
 
 
@@ -313,22 +425,7 @@ def new_agent(
         typer.echo(f"File already exists: {file_path}. Use --force to overwrite.")
         raise typer.Exit(code=1)
 
-    content = f'''
-from .base import Agent, AgentConfig
-from typing import Any
-import logging
-
-
-class {class_name}(Agent):
-    """Example agent generated by CLI."""
-
-    def __init__(self, config: AgentConfig):
-        super().__init__(config)
-
-    def run(self, **kwargs: Any) -> Any:
-        logging.info("{class_name} is running")
-        return {{"message": "Hello from {class_name}"}}
-'''.lstrip()
+    content = _AGENT_TEMPLATE.format_map({"class_name": class_name})
 
     file_path.write_text(content, encoding="utf-8")
     typer.echo(f"Created agent: {file_path}")
@@ -357,12 +454,94 @@ def _history_dir() -> Path:
     return Path(base) if base else Path("logs")
 
 
+# History file paths by (absolute directory, day), for directories already created
+_PATH_CACHE: dict[tuple[str, str], Path] = {}
+
+
 def _history_path_for(date: Optional[datetime] = None) -> Path:
     """Compute the JSONL history path for the given date (defaults to today)."""
     d = (date or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
     p = _history_dir()
-    p.mkdir(parents=True, exist_ok=True)
-    return p / f"history_{d}.jsonl"
+    key = (str(p) if p.is_absolute() else os.path.join(os.getcwd(), p), d)
+    path = _PATH_CACHE.get(key)
+    if path is None:
+        # mkdir only on the first use of a directory, not on every summary written
+        p.mkdir(parents=True, exist_ok=True)
+        path = _PATH_CACHE[key] = p / f"history_{d}.jsonl"
+    return path
+
+
+def _iter_jsonl_reverse(path: Path, blocksize: int = 65536) -> Iterator[str]:
+    """Yield the non-empty lines of a UTF-8 JSONL file newest-first, reading it backwards in blocks."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""  # start of the line that continues into the block already read
+        while pos > 0:
+            step = min(blocksize, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines[0]
+            for raw in reversed(lines[1:]):
+                raw = raw.rstrip(b"\r")
+                if raw:
+                    yield raw.decode("utf-8")
+        tail = tail.rstrip(b"\r")
+        if tail:
+            yield tail.decode("utf-8")
+
+
+_CONTAINER_BRACKETS = {dict: ("{", "}"), list: ("[", "]"), tuple: ("(", ")")}
+
+
+def _repr_pieces(obj: Any, active: set[int]) -> Iterator[str]:
+    """Yield ``repr(obj)`` piece by piece, descending into plain dicts, lists and tuples."""
+    cls = type(obj)
+    brackets = _CONTAINER_BRACKETS.get(cls)
+    if brackets is None:
+        yield repr(obj)
+        return
+    opening, closing = brackets
+    if id(obj) in active:
+        # Self-reference, rendered the way repr() does
+        yield f"{opening}...{closing}"
+        return
+    active.add(id(obj))
+    try:
+        yield opening
+        for i, item in enumerate(obj.items() if cls is dict else obj):
+            if i:
+                yield ", "
+            if cls is dict:
+                yield from _repr_pieces(item[0], active)
+                yield ": "
+                yield from _repr_pieces(item[1], active)
+            else:
+                yield from _repr_pieces(item, active)
+        if cls is tuple and len(obj) == 1:
+            yield ","
+        yield closing
+    finally:
+        active.discard(id(obj))
+
+
+def _truncated_repr(data: object, limit: int) -> str:
+    """Return ``str(data)[:limit]`` without rendering the rest of a large dict/list/tuple result."""
+    if type(data) is str:
+        return data[:limit]
+    if type(data) not in _CONTAINER_BRACKETS:
+        return str(data)[:limit]
+    parts: list[str] = []
+    size = 0
+    try:
+        for piece in _repr_pieces(data, set()):
+            parts.append(piece)
+            size += len(piece)
+            if size >= limit:
+                break
+    except RecursionError:
+        return str(data)[:limit]
+    return "".join(parts)[:limit]
 
 
 def _persist_session_summary(agent: str, status: str, message: Optional[str], data: object) -> None:
@@ -370,10 +549,11 @@ def _persist_session_summary(agent: str, status: str, message: Optional[str], da
     try:
         preview = None
         if data is not None:
-            s = str(data)
-            preview = s[:200]
-            preview = Redactor.redact(preview)
-        summary = SessionSummary(
+            # Only the first 200 characters are kept, so large results are not rendered in full
+            preview = Redactor.redact(_truncated_repr(data, 200))
+        from agents.base import SessionSummary
+
+        summary = SessionSummary.from_trusted(
             timestamp=datetime.now(timezone.utc),
             agent=agent,
             status=status,
@@ -382,9 +562,17 @@ def _persist_session_summary(agent: str, status: str, message: Optional[str], da
             tags=_current_tags(),
         )
         path = _history_path_for()
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(summary.model_dump_json())
-            f.write("\n")
+        # One unbuffered O_APPEND write per line: no buffer setup, and concurrent
+        # sessions appending to the same day's file never interleave partial lines
+        payload = summary.to_json_bytes() + b"\n"
+        try:
+            f = open(path, "ab", buffering=0)
+        except FileNotFoundError:
+            # The directory was removed after its path was cached
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, "ab", buffering=0)
+        with f:
+            f.write(payload)
         logging.debug("Saved session summary to %s", path)
     except Exception as e:
         logging.debug(
@@ -413,6 +601,8 @@ def history_show(
             dt = datetime.strptime(date, "%Y-%m-%d")
         except ValueError:
             raise typer.BadParameter("--date must be in YYYY-MM-DD format")
+    if limit < 0:
+        raise typer.BadParameter("--limit must be >= 0")
     path = _history_path_for(dt)
     if not path.exists():
         typer.echo(
@@ -422,12 +612,18 @@ def history_show(
             )
         )
         raise typer.Exit(code=0)
-    lines = path.read_text(encoding="utf-8").splitlines()
-    # newest-first
-    filtered: list[tuple[str, dict]] = []
-    for line in reversed(lines):
+    start = max(0, int(offset))
+    end = start + int(limit) if limit else None
+    # Single newest-first pass: matches before the page are only counted, so memory
+    # stays proportional to the page rather than the day's file
+    page: list[tuple[str, dict]] = []
+    matched = 0
+    prefilter = bool(contains) and _json_verbatim(contains)
+    for line in _iter_jsonl_reverse(path):
+        if prefilter and contains not in line:
+            continue
         try:
-            obj = json.loads(line)
+            obj = _json_loads(line)
         except Exception:
             continue
         if agent and obj.get("agent") != agent:
@@ -439,10 +635,13 @@ def history_show(
             continue
         if tag and not (obj.get("tags") and tag in obj.get("tags", [])):
             continue
-        filtered.append((line, obj))
-    start = max(0, int(offset))
-    end = start + int(limit) if limit else None
-    page = filtered[start:end]
+        matched += 1
+        if matched <= start:
+            continue
+        page.append((line, obj))
+        # Older entries cannot reach the requested page, so stop reading the file
+        if end is not None and matched >= end:
+            break
     if json_out:
         typer.echo(json.dumps([obj for _, obj in page], ensure_ascii=False))
     else:
@@ -455,13 +654,19 @@ def history_show(
 # ---------------------
 
 def _deep_merge(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
-    """Recursively merge mapping ``b`` into ``a`` without mutating inputs."""
+    """Deep-merge mapping ``b`` into ``a`` without mutating inputs."""
     out: dict[str, Any] = dict(a)
-    for k, v in (b or {}).items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = _deep_merge(out[k], v)
-        else:
-            out[k] = v
+    # Explicit work stack instead of recursion; nested dicts taken from ``a`` are
+    # copied before being written to, so the inputs stay untouched
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(out, b or {})]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict) and isinstance(dst.get(k), dict):
+                dst[k] = dict(dst[k])
+                stack.append((dst[k], v))
+            else:
+                dst[k] = v
     return out
 
 
@@ -481,8 +686,53 @@ def _parse_params(params: Optional[list[str]]) -> dict[str, Any]:
     return result
 
 
-def _build_agent_config(agent: str, config_path: Optional[Path], cli_params: Optional[list[str]]) -> AgentConfig:
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML config file, reusing a cached JSON copy while the file is unchanged.
+
+    The copy lives under ``_config_dir()/yaml_cache``, keyed by the file's path and
+    validated against its mtime and size, so a hit skips importing and running the
+    YAML parser. Values JSON cannot represent exactly (dates, non-string keys) are
+    never cached. The cache is opt-in: set ``FTSYSTEM_CONFIG_CACHE=1`` to enable it.
+    """
+    st = path.stat()
+    source = [st.st_mtime_ns, st.st_size]
+    cache_path: Optional[Path] = None
+    if os.environ.get("FTSYSTEM_CONFIG_CACHE") == "1":
+        digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+        cache_path = _config_dir() / "yaml_cache" / f"{digest}.json"
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached["source"] == source:
+                return cached["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    try:
+        import yaml  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError(f"YAML support is required to load {path}: {type(e).__name__}: {e}") from e
+    # LibYAML's C parser when PyYAML was built with it (same safe constructors)
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=loader)
+    if cache_path is not None:
+        try:
+            text = json.dumps({"source": source, "data": data}, ensure_ascii=False)
+            if json.loads(text)["data"] == data:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, cache_path)
+        except (OSError, TypeError, ValueError):
+            # The cache is best-effort; the parsed data is already in hand
+            pass
+    return data
+
+
+def _build_agent_config(agent: str, config_path: Optional[Path], cli_params: Optional[list[str]]) -> "AgentConfig":
     """Assemble an AgentConfig from file, environment, and CLI overrides."""
+    from agents.base import AgentConfig
+
     data: dict[str, Any] = {}
     logging.debug(
         "[config] building config for agent=%s (config_path=%s, cli_params=%s)",
@@ -494,14 +744,7 @@ def _build_agent_config(agent: str, config_path: Optional[Path], cli_params: Opt
         suffix = config_path.suffix.lower()
         try:
             if suffix in {".yml", ".yaml"}:
-                try:
-                    import yaml  # type: ignore
-                except Exception as e:  # pragma: no cover
-                    raise RuntimeError(
-                        f"YAML support is required to load {config_path}: {type(e).__name__}: {e}"
-                    ) from e
-                with open(config_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                data = _load_yaml(config_path) or {}
             else:
                 with open(config_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -605,6 +848,77 @@ def _current_tags() -> list[str]:
     return list(_TAGS)
 
 
+def _map_history_files(fn: Any, paths: list[Path]) -> list[Any]:
+    """Apply ``fn`` to each history file on a thread pool, so file reads overlap; results keep ``paths`` order."""
+    if len(paths) < 2:
+        return [fn(path) for path in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths)), thread_name_prefix="history") as pool:
+        return list(pool.map(fn, paths))
+
+
+# Characters every JSON encoder writes verbatim inside strings: printable ASCII without
+# the always-escaped quote and backslash, and without "/<>&'", which some encoders escape
+_JSON_VERBATIM = frozenset(map(chr, range(0x20, 0x7F))) - set("\"\\/<>&'")
+
+
+def _json_verbatim(needle: str) -> bool:
+    """Return True if ``needle`` appears unchanged in the raw JSON of any string containing it."""
+    return _JSON_VERBATIM.issuperset(needle)
+
+
+def _find_in_history_file(path: Path, needle: str, agent: Optional[str]) -> list[dict]:
+    """Return entries of one history file whose message or data preview contains ``needle``."""
+    try:
+        lines = path.read_bytes().split(b"\n")
+    except Exception:
+        return []
+    # Lines without the needle anywhere cannot match, so skip parsing them
+    raw_needle = needle.encode("utf-8") if _json_verbatim(needle) else None
+    hits: list[dict] = []
+    for line in lines:
+        if raw_needle is not None and raw_needle not in line:
+            continue
+        try:
+            obj = _json_loads(line)
+        except Exception:
+            continue
+        if agent and obj.get("agent") != agent:
+            continue
+        if not (
+            (obj.get("message") and needle in obj.get("message", ""))
+            or (obj.get("data_preview") and needle in obj.get("data_preview", ""))
+        ):
+            continue
+        obj_with_src = dict(obj)
+        obj_with_src["_file"] = str(path)
+        hits.append(obj_with_src)
+    return hits
+
+
+def _count_history_file(path: Path, agent: Optional[str]) -> tuple[int, Counter[str], Counter[str]]:
+    """Return (total, by_agent, by_status) counts for one history file."""
+    agents: list[str] = []
+    statuses: list[str] = []
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except Exception:
+        lines = []
+    for line in lines:
+        try:
+            obj = _json_loads(line)
+        except Exception:
+            continue
+        ag = str(obj.get("agent", ""))
+        if agent and ag != agent:
+            continue
+        agents.append(ag)
+        statuses.append(str(obj.get("status", "")))
+    # Counter counts a whole sequence in one C-level pass
+    return len(agents), Counter(agents), Counter(statuses)
+
+
 @history_app.command("find")
 def history_find(
     contains: str = typer.Option(..., "--contains", help="Substring to search in message/data"),
@@ -644,28 +958,8 @@ def history_find(
         if date_from is None or fd >= date_from:
             selected.append((fd, f))
     selected.sort(key=lambda t: t[0], reverse=bool(reverse))
-    hits: list[dict] = []
-    needle = contains
-    for _, path in selected:
-        try:
-            lines = path.read_text(encoding="utf-8").splitlines()
-        except Exception:
-            continue
-        for line in lines:
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if agent and obj.get("agent") != agent:
-                continue
-            if not (
-                (obj.get("message") and needle in obj.get("message", ""))
-                or (obj.get("data_preview") and needle in obj.get("data_preview", ""))
-            ):
-                continue
-            obj_with_src = dict(obj)
-            obj_with_src["_file"] = str(path)
-            hits.append(obj_with_src)
+    scan = functools.partial(_find_in_history_file, needle=contains, agent=agent)
+    hits = [hit for file_hits in _map_history_files(scan, [path for _, path in selected]) for hit in file_hits]
     total = len(hits)
     # apply offset + limit
     start = max(0, int(offset))
@@ -702,10 +996,7 @@ def history_stats(
         today = _date.today()
         d = max(0, int(days))
         date_from = _date.fromordinal(today.toordinal() - max(0, d - 1))
-    # Aggregate
-    by_agent: dict[str, int] = {}
-    by_status: dict[str, int] = {}
-    total = 0
+    selected: list[Path] = []
     for f in files:
         try:
             dstr = f.stem.split("_")[1]
@@ -714,22 +1005,16 @@ def history_stats(
             continue
         if date_from is not None and fd < date_from:
             continue
-        try:
-            lines = f.read_text(encoding="utf-8").splitlines()
-        except Exception:
-            continue
-        for line in lines:
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            ag = str(obj.get("agent", ""))
-            if agent and ag != agent:
-                continue
-            total += 1
-            st = str(obj.get("status", ""))
-            by_agent[ag] = by_agent.get(ag, 0) + 1
-            by_status[st] = by_status.get(st, 0) + 1
+        selected.append(f)
+    # Aggregate per-file partial counts, merged in file order
+    by_agent: Counter[str] = Counter()
+    by_status: Counter[str] = Counter()
+    total = 0
+    count = functools.partial(_count_history_file, agent=agent)
+    for file_total, file_by_agent, file_by_status in _map_history_files(count, selected):
+        total += file_total
+        by_agent.update(file_by_agent)
+        by_status.update(file_by_status)
     if json_out:
         typer.echo(json.dumps({"total": total, "by_agent": by_agent, "by_status": by_status}, ensure_ascii=False))
         return
@@ -754,10 +1039,10 @@ def security_redact(
     if not inp.exists():
         typer.echo(f"Input not found: {inp}", err=True)
         raise typer.Exit(code=1)
-    text = inp.read_text(encoding="utf-8", errors="ignore")
-    red = Redactor.redact(text) or ""
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(red, encoding="utf-8")
+    # Stream line by line so large logs are never held in memory whole
+    with inp.open("r", encoding="utf-8", errors="ignore") as src, out.open("w", encoding="utf-8") as dst:
+        Redactor.redact_stream(src, dst)
     typer.echo(f"Wrote redacted text to {out}")
 
 
@@ -781,13 +1066,12 @@ def history_export(
     if not path.exists():
         typer.echo(f"No history for date: {date or datetime.now(timezone.utc).strftime('%Y-%m-%d')}")
         raise typer.Exit(code=0)
-    lines = path.read_text(encoding="utf-8").splitlines()
     out.parent.mkdir(parents=True, exist_ok=True)
     count = 0
     with out.open("w", encoding="utf-8") as f:
-        for line in reversed(lines):
+        for line in _iter_jsonl_reverse(path):
             try:
-                obj = json.loads(line)
+                obj = _json_loads(line)
             except Exception:
                 continue
             if agent and obj.get("agent") != agent:
@@ -919,7 +1203,7 @@ def history_replay(
     pretty: list[str] = []
     for line in lines:
         try:
-            obj = json.loads(line)
+            obj = _json_loads(line)
         except Exception:
             continue
         ts = str(obj.get("timestamp", ""))
@@ -967,9 +1251,12 @@ def interactive(
     dry_run_tts: bool = typer.Option(False, "--dry-run-tts", help="Log TTS text instead of speaking (for tests)"),
 ):
     """Interactive loop that maintains session and writes summaries."""
-    if agent not in AGENT_REGISTRY:
+    from agents.base import AgentConfig
+
+    registry = _get_registry()
+    if agent not in registry:
         typer.echo(
-            f"Agent '{agent}' not found. Available: {list(AGENT_REGISTRY.keys())}",
+            f"Agent '{agent}' not found. Available: {list(registry.keys())}",
             err=True,
         )
         raise typer.Exit(code=1)
@@ -979,10 +1266,7 @@ def interactive(
         try:
             suffix = config.suffix.lower()
             if suffix in {".yml", ".yaml"}:
-                import yaml  # type: ignore
-
-                with open(config, "r", encoding="utf-8") as f:
-                    config_data = yaml.safe_load(f) or {}
+                config_data = _load_yaml(config) or {}
             else:
                 with open(config, "r", encoding="utf-8") as f:
                     config_data = json.load(f)
@@ -996,7 +1280,7 @@ def interactive(
     else:
         agent_config = AgentConfig(name=agent, description=f"Interactive config for {agent}")
 
-    agent_instance = AGENT_REGISTRY[agent](agent_config)
+    agent_instance = registry[agent](agent_config)
     # Tags
     _set_current_tags(tag)
     typer.echo("Interactive mode. Type /exit to quit, /help for help.")
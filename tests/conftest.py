@@ -1,8 +1,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure src/ is in sys.path for all tests
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
+
+@pytest.fixture(autouse=True)
+def _isolated_config_dir(tmp_path, monkeypatch):
+    """Keep CLI config artifacts (voice profile, YAML cache) out of the working tree."""
+    monkeypatch.setenv("FTSYSTEM_CONFIG_DIR", str(tmp_path / "ftsystem_config"))
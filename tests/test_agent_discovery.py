@@ -19,6 +19,17 @@ def test_hello_agent_run():
         print("HelloAgent not found in registry.")
         assert False, "HelloAgent not found in AGENT_REGISTRY!"
 
+def test_agent_core_modules_are_unique():
+    # One canonical AgentConfig and one registry package; duplicates would be imported
+    # (and their pydantic models built) twice.
+    from pathlib import Path
+
+    src = Path(__file__).parent.parent / "src"
+    defining = [p for p in src.rglob("*.py") if "class AgentConfig(" in p.read_text(encoding="utf-8")]
+    assert [p.relative_to(src).as_posix() for p in defining] == ["agents/base.py"]
+    registries = [p for p in src.rglob("__init__.py") if "AGENT_REGISTRY" in p.read_text(encoding="utf-8")]
+    assert [p.relative_to(src).as_posix() for p in registries] == ["agents/__init__.py"]
+
 if __name__ == "__main__":
     test_agent_registry_listing()
     test_hello_agent_run()
\ No newline at end of file
@@ -101,3 +101,14 @@ def test_cli_new_agent_generates_files(tmp_path):
     assert cfg.exists(), res.output
     text = agent_file.read_text(encoding="utf-8")
     assert "class SampleAgent(Agent):" in text
+
+
+def test_from_trusted_skips_validation_but_keeps_defaults():
+    """from_trusted builds models without validation while applying defaults."""
+    from agents.base import Message
+
+    cfg = AgentConfig.from_trusted(name="x", description="y")
+    assert cfg.params is None
+    msg = Message.from_trusted(role="agent", agent="A", content="hi")
+    assert msg.timestamp is not None
+    assert msg.model_dump(mode="json")["content"] == "hi"
@@ -1,8 +1,8 @@
 """Tests for the Analyst Agent."""
 
 import pytest
-from src.agents.analyst_agent import AnalystAgent
-from src.agents.base import AgentConfig
+from agents.analyst_agent import AnalystAgent
+from agents.base import AgentConfig
 
 
 class TestAnalystAgent:
@@ -192,3 +192,23 @@ class TestAnalystAgent:
         result = agent.run(data=data)
         
         assert result["analysis_type"] == "anomaly"
+
+    def test_analyst_recommendations_detect_keywords_without_flags(self):
+        """Keyword recommendations are derived from insight text when no flags are given."""
+        agent = AnalystAgent(AgentConfig(name="analyst", description="Test"))
+        recs = agent._generate_recommendations(["Pattern 'temporal_trend': detected"])
+        assert "Consider forecasting methods for trend analysis" in recs
+        assert not any("outliers" in r for r in recs)
+
+    def test_analyst_anomaly_type_recommends_outlier_review(self):
+        """An anomaly analysis adds the outlier recommendation."""
+        config = AgentConfig(name="analyst", description="Test", params={"analysis_type": "anomaly"})
+        result = AnalystAgent(config).run(data=[1, 2, 3])
+        assert "Investigate outliers to determine if they are errors or significant events" in result["recommendations"]
+
+    @pytest.mark.parametrize("analysis_type", ["general", "trend", "correlation"])
+    def test_analyst_other_types_skip_outlier_review(self, analysis_type):
+        """Analysis types other than anomaly never add the outlier recommendation."""
+        config = AgentConfig(name="analyst", description="Test", params={"analysis_type": analysis_type})
+        result = AnalystAgent(config).run(data=[1, 2, 3])
+        assert not any("outliers" in r for r in result["recommendations"])
@@ -25,3 +25,17 @@ def test_run_command_in_polish_language():
     assert result.exit_code != 0
     assert "nie został znaleziony" in result.output
 
+
+def test_translate_matches_str_format_semantics():
+    from core.i18n import I18N
+
+    previous = I18N.get_language()
+    I18N.set_language("en")
+    try:
+        assert I18N.translate("no_history", date="2025-01-01") == "No history for date: 2025-01-01"
+        # Missing placeholders fall back to the raw template
+        assert I18N.translate("no_history") == "No history for date: {date}"
+        # Unknown keys are used as templates, including escapes and format specs
+        assert I18N.translate("{{x}} {n:>3}", n=7) == "{x}   7"
+    finally:
+        I18N.set_language(previous)
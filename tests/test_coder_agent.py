@@ -1,8 +1,8 @@
 """Tests for the Coder Agent."""
 
 import pytest
-from src.agents.coder_agent import CoderAgent
-from src.agents.base import AgentConfig
+from agents.coder_agent import CoderAgent
+from agents.base import AgentConfig
 
 
 class TestCoderAgent:
@@ -53,3 +53,34 @@ params:
     assert data["params"]["c"] == 3
     assert data["params"]["d"] == "ok"
 
+
+def test_yaml_config_cache_tracks_file_changes(tmp_path, monkeypatch):
+    import main
+
+    monkeypatch.setenv("FTSYSTEM_CONFIG_DIR", str(tmp_path / "cfgdir"))
+    monkeypatch.setenv("FTSYSTEM_CONFIG_CACHE", "1")
+    cfg = tmp_path / "agent.yaml"
+    cfg.write_text("name: first\ndescription: d\n", encoding="utf-8")
+    assert main._load_yaml(cfg) == {"name": "first", "description": "d"}
+    assert len(list((tmp_path / "cfgdir" / "yaml_cache").glob("*.json"))) == 1
+    # Served from the cache on the next call, refreshed once the file changes
+    assert main._load_yaml(cfg) == {"name": "first", "description": "d"}
+    cfg.write_text("name: second\ndescription: d\n", encoding="utf-8")
+    assert main._load_yaml(cfg)["name"] == "second"
+    # Values JSON cannot round-trip are returned as parsed and never cached
+    dated = tmp_path / "dated.yaml"
+    dated.write_text("when: 2024-01-02\n1: one\n", encoding="utf-8")
+    first = main._load_yaml(dated)
+    assert main._load_yaml(dated) == first and 1 in first
+    assert len(list((tmp_path / "cfgdir" / "yaml_cache").glob("*.json"))) == 1
+
+
+def test_yaml_config_cache_is_opt_in(tmp_path, monkeypatch):
+    import main
+
+    monkeypatch.setenv("FTSYSTEM_CONFIG_DIR", str(tmp_path / "cfgdir"))
+    monkeypatch.delenv("FTSYSTEM_CONFIG_CACHE", raising=False)
+    cfg = tmp_path / "agent.yaml"
+    cfg.write_text("name: first\ndescription: d\n", encoding="utf-8")
+    assert main._load_yaml(cfg) == {"name": "first", "description": "d"}
+    assert not (tmp_path / "cfgdir").exists()
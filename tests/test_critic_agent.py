@@ -0,0 +1,64 @@
+"""Tests for the Critic Agent."""
+
+import pytest
+from agents.critic_agent import CriticAgent
+from agents.base import AgentConfig
+
+
+class TestCriticAgent:
+    """Test suite for Critic Agent."""
+
+    def test_critic_missing_content(self):
+        """Test that missing content raises ValueError."""
+        agent = CriticAgent(AgentConfig(name="critic", description="Test critic"))
+
+        with pytest.raises(ValueError, match="Content is required for review"):
+            agent.run()
+
+    def test_critic_clean_content_approved(self):
+        """Test that clean, sufficiently long content is approved."""
+        agent = CriticAgent(AgentConfig(name="critic", description="Test critic"))
+
+        result = agent.run(content="A well structured paragraph about the topic. " * 3)
+
+        assert result["approval_status"] == "approved"
+        assert result["issues_found"] == []
+        assert result["overall_score"] == pytest.approx(0.85)
+
+    def test_critic_markers_detected(self):
+        """Test that TODO/unclear/blank-line markers become issues and lower scores."""
+        agent = CriticAgent(AgentConfig(name="critic", description="Test critic"))
+
+        content = "Intro paragraph that is long enough to review.\n\n\nTODO: finish. Very UNCLEAR part."
+        result = agent.run(content=content)
+
+        types = {issue["type"] for issue in result["issues_found"]}
+        assert types == {"incomplete_work", "unclear_sections", "formatting"}
+        assert result["quality_scores"]["completeness"] == pytest.approx(0.60)
+        assert result["quality_scores"]["clarity"] == pytest.approx(0.73)
+        assert result["approval_status"] == "needs_revision"
+
+    def test_critic_strict_rejects_incomplete_work(self):
+        """Test that strict reviews turn unfinished markers into errors."""
+        config = AgentConfig(
+            name="critic", description="Test critic", params={"strictness_level": "strict"}
+        )
+        agent = CriticAgent(config)
+
+        result = agent.run(content="FIXME " * 20, context="code review")
+
+        assert result["approval_status"] == "rejected"
+        assert "Add comments explaining complex logic" in result["suggestions"]
+
+    def test_critic_repeated_review_returns_independent_results(self):
+        """Test that reviewing the same content twice does not share mutable results."""
+        agent = CriticAgent(AgentConfig(name="critic", description="Test critic"))
+        content = "TODO: expand this section before review."
+
+        first = agent.run(content=content)
+        first["quality_scores"]["clarity"] = 0.0
+        first["issues_found"].clear()
+        second = agent.run(content=content)
+
+        assert second["quality_scores"]["clarity"] > 0.0
+        assert {issue["type"] for issue in second["issues_found"]} >= {"incomplete_work"}
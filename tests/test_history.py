@@ -35,3 +35,32 @@ def test_history_persist_and_show(tmp_path):
             break
     assert found, res_hist.output
 
+
+def test_truncated_repr_matches_str_prefix():
+    from main import _truncated_repr
+
+    loop: list = [1]
+    loop.append(loop)
+    samples = [
+        "plain text",
+        {"a": [1, (2,), ()], 3: {"q": "it's"}, None: 'say "hi"'},
+        [{"title": f"t{i}", "v": i / 3} for i in range(1000)],
+        loop,
+        (1.5, b"raw", {1, 2}),
+    ]
+    for data in samples:
+        for limit in (5, 200, 100_000):
+            assert _truncated_repr(data, limit) == str(data)[:limit]
+
+
+def test_history_dir_recreated_after_removal(tmp_path):
+    import shutil
+
+    hist_dir = tmp_path / "hist"
+    env = {**os.environ, "FTSYSTEM_HISTORY_DIR": str(hist_dir)}
+    runner = CliRunner()
+    assert runner.invoke(app, ["run", "--agent", "HelloAgent"], env=env).exit_code == 0
+    shutil.rmtree(hist_dir)
+    assert runner.invoke(app, ["run", "--agent", "HelloAgent"], env=env).exit_code == 0
+    files = list(hist_dir.glob("history_*.jsonl"))
+    assert len(files) == 1 and len(files[0].read_text(encoding="utf-8").splitlines()) == 1
@@ -32,3 +32,22 @@ def test_history_filters_by_agent_and_contains(tmp_path):
         assert obj.get("agent") == "HelloAgent"
         assert "Hello" in (obj.get("message") or "") or "Hello" in (obj.get("data_preview") or "")
 
+
+def test_history_reverse_reader_matches_splitlines(tmp_path):
+    from main import _iter_jsonl_reverse
+
+    path = tmp_path / "h.jsonl"
+    lines = ['{"n": %d, "m": "%s"}' % (i, "ż" * (i % 7)) for i in range(50)]
+    path.write_bytes(("\n".join(lines) + "\r\n\n").encode("utf-8"))
+    # Tiny blocks split lines (and multi-byte characters) across reads
+    assert list(_iter_jsonl_reverse(path, blocksize=5)) == lines[::-1]
+    assert list(_iter_jsonl_reverse(path)) == lines[::-1]
+
+
+def test_history_show_rejects_negative_limit(tmp_path):
+    env = {**os.environ, "FTSYSTEM_HISTORY_DIR": str(tmp_path / "hist")}
+    runner = CliRunner()
+    assert runner.invoke(app, ["run", "--agent", "HelloAgent"], env=env).exit_code == 0
+    res = runner.invoke(app, ["history", "show", "--limit", "-1"], env=env)
+    assert res.exit_code != 0
+    assert "--limit must be >= 0" in res.output
@@ -54,3 +54,34 @@ def test_history_stats_json(tmp_path: Path):
     data_a = json.loads(res_stats_a.output)
     assert data_a["total"] >= 2
     assert list(data_a["by_agent"].keys()) == ["HelloAgent"]
+
+
+def test_history_stats_merges_counts_across_days(tmp_path: Path):
+    runner = CliRunner()
+    pdir = tmp_path / "hist3"
+    pdir.mkdir()
+    for back, agents in ((0, ["A", "B"]), (1, ["B", "B"]), (2, ["C"])):
+        day = (datetime.now(timezone.utc) - timedelta(days=back)).strftime("%Y-%m-%d")
+        lines = [json.dumps({"agent": a, "status": "ok" if a != "C" else "error"}) for a in agents]
+        (pdir / f"history_{day}.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    res = runner.invoke(app, ["history", "stats", "--json"], env={"FTSYSTEM_HISTORY_DIR": str(pdir)})
+    assert res.exit_code == 0, res.output
+    data = json.loads(res.output)
+    assert data["total"] == 5
+    assert data["by_agent"] == {"A": 1, "B": 3, "C": 1}
+    assert data["by_status"] == {"ok": 4, "error": 1}
+
+
+def test_history_find_matches_escaped_json(tmp_path: Path):
+    runner = CliRunner()
+    pdir = tmp_path / "hist4"
+    pdir.mkdir()
+    day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    entries = [{"agent": "A", "message": 'say "żółw" a/b'}, {"agent": "A", "message": "plain"}]
+    # ensure_ascii escapes non-ASCII, so the raw line differs from the decoded text
+    (pdir / f"history_{day}.jsonl").write_text("\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
+    env = {"FTSYSTEM_HISTORY_DIR": str(pdir)}
+    for needle in ['"żółw"', "a/b", "say", "plain"]:
+        res = runner.invoke(app, ["history", "find", "--contains", needle, "--json"], env=env)
+        assert res.exit_code == 0, res.output
+        assert json.loads(res.output)["total"] == 1, needle
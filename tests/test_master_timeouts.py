@@ -38,3 +38,34 @@ params:
     assert "SlowAgent" in results
     assert isinstance(results["SlowAgent"], dict) and results["SlowAgent"].get("error") == "timeout"
 
+
+def test_slow_agent_duration_and_async_run():
+    import asyncio
+
+    from agents.base import AgentConfig
+    from agents.slow_agent import SlowAgent
+
+    agent = SlowAgent(AgentConfig(name="slow", description="test", params={"duration": 0.01}))
+    assert agent.duration == 0.01
+    assert agent.run() == "slow"
+    assert asyncio.run(agent.arun()) == "slow"
+
+
+def test_master_awaits_slow_agents_without_threads(monkeypatch):
+    import time
+
+    from agents import AGENT_REGISTRY
+    from agents.base import AgentConfig
+    from agents.slow_agent import SlowAgent
+
+    def _blocking_run(self, **kwargs):
+        raise AssertionError("SlowAgent should be awaited, not run in a thread")
+
+    monkeypatch.setattr(SlowAgent, "duration", property(lambda self: 0.01))
+    monkeypatch.setattr(SlowAgent, "run", _blocking_run)
+    cls = AGENT_REGISTRY["MasterAgent"]
+    agent = cls(AgentConfig(name="master", description="test", params={"subagents": ["SlowAgent"], "rounds": 3}))
+    start = time.perf_counter()
+    res = agent.run()
+    assert res["results"] == {"SlowAgent": "slow"}
+    assert time.perf_counter() - start < 1.0
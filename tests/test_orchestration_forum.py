@@ -27,3 +27,112 @@ def test_master_agent_forum_transcript():
     has_hello = any(m.get("agent") == "HelloAgent" for m in transcript if m.get("role") == "agent")
     assert has_hello
 
+
+def test_forum_messages_get_fresh_timestamps():
+    from datetime import datetime, timezone
+
+    from core.forum import Forum
+
+    before = datetime.now(timezone.utc)
+    msg = Forum().post("system", "hello")
+    assert msg.timestamp >= before
+
+
+def test_structured_results_are_posted_as_bounded_json():
+    import json
+
+    from agents.master_agent import _FORUM_BODY_LIMIT, _forum_body
+
+    assert _forum_body("plain") == "plain"
+    assert json.loads(_forum_body({"score": 0.5, "items": ["a"]})) == {"score": 0.5, "items": ["a"]}
+    body = _forum_body({"text": "word " * 2000})
+    assert len(body) <= _FORUM_BODY_LIMIT and body.endswith(" ...")
+    # One long value has no late separator; the cut keeps most of it anyway
+    body = _forum_body({"k": "y" * 5000})
+    assert len(body) == _FORUM_BODY_LIMIT and body.startswith('{"k": "yyy')
+
+
+def test_forum_body_falls_back_to_str_for_non_json_results():
+    from agents.master_agent import _forum_body
+
+    assert _forum_body({(1, 2): "x"}) == str({(1, 2): "x"})
+    cyclic: list = []
+    cyclic.append(cyclic)
+    assert _forum_body(cyclic) == "[[...]]"
+
+
+def test_master_keeps_results_json_cannot_encode():
+    from agents import AGENT_REGISTRY
+    from agents.base import Agent, AgentConfig
+
+    class TupleKeyAgent(Agent):
+        def run(self, **kwargs):
+            return {(1, 2): "x"}
+
+    AGENT_REGISTRY["TupleKeyAgent"] = TupleKeyAgent
+    try:
+        master = AGENT_REGISTRY["MasterAgent"](
+            AgentConfig(name="master", description="test", params={"subagents": ["TupleKeyAgent"]})
+        )
+        res = master.run()
+    finally:
+        del AGENT_REGISTRY["TupleKeyAgent"]
+    assert res["results"] == {"TupleKeyAgent": {(1, 2): "x"}}
+    assert res["metrics"]["success"] == {"TupleKeyAgent": 1.0}
+
+
+def test_forum_bounded_transcript_keeps_newest_messages():
+    from core.forum import Forum
+
+    forum = Forum(max_messages=2)
+    for i in range(5):
+        forum.post("agent", f"msg {i}", agent="A")
+    dumped = forum.to_dict()
+    assert [m["content"] for m in dumped] == ["msg 3", "msg 4"]
+    assert dumped == [m.model_dump(mode="json") for m in forum.messages()]
+
+
+def test_forum_post_rejects_unknown_roles():
+    import pytest
+    from pydantic import ValidationError
+
+    from core.forum import Forum
+
+    forum = Forum()
+    assert forum.post("user", "hi").role == "user"
+    with pytest.raises(ValidationError):
+        forum.post("admin", "hi")
+    assert len(forum.messages()) == 1
+
+
+def test_forum_trusted_post_matches_validated_post():
+    from core.forum import Forum
+
+    forum = Forum()
+    fast = forum.post_trusted("agent", "done", agent="A")
+    checked = forum.post("agent", "done", agent="A")
+    assert fast.model_dump(exclude={"timestamp"}) == checked.model_dump(exclude={"timestamp"})
+
+
+def test_forum_json_bytes_match_dict_form():
+    import json
+
+    from core.forum import Forum
+
+    forum = Forum()
+    forum.post("system", "start", agent="MasterAgent")
+    forum.post("user", "zażółć \"quoted\"")
+    assert json.loads(forum.to_json_bytes()) == forum.to_dict()
+
+
+def test_forum_messages_are_immutable():
+    import pytest
+    from pydantic import ValidationError
+
+    from core.forum import Forum
+
+    forum = Forum()
+    msg = forum.post("agent", "done", agent="A")
+    with pytest.raises(ValidationError):
+        msg.content = "edited"
+    assert forum.to_dict()[0]["content"] == "done"
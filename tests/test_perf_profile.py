@@ -38,3 +38,15 @@ def test_perf_profile_json_output():
     assert data["rounds"] == 1
     assert "subagents" in data
 
+
+def test_perf_profile_concurrent_runs():
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["perf", "profile", "--agent", "MasterAgent", "--repeat", "4", "--concurrency", "2", "--json"],
+    )
+    assert result.exit_code == 0, result.output
+    text = result.stdout or result.output
+    data = json.loads(text[text.find("{"):])
+    assert data["runs"] == 4 and len(data["durations"]) == 4
+    assert data["concurrency"] == 2
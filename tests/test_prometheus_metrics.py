@@ -28,3 +28,35 @@ def test_metrics_export_from_run(tmp_path):
     assert "ftsystem_run_duration_seconds" in text
     assert 'ftsystem_subagent_latency_seconds{agent="MasterAgent"' in text
 
+
+def test_metrics_skip_empty_subagent_sections(tmp_path):
+    from core.metrics import PrometheusExporter
+
+    path = tmp_path / "m.prom"
+    PrometheusExporter.write_metrics(path, "MasterAgent", 0.5, {"metrics": {"latency": {}, "success": {"A": 1.0}}})
+    text = path.read_text(encoding="utf-8")
+    assert "ftsystem_subagent_latency_seconds" not in text
+    assert 'ftsystem_subagent_success_total{agent="MasterAgent",subagent="A"} 1.0' in text
+
+
+def test_metrics_skip_boolean_samples(tmp_path):
+    from core.metrics import PrometheusExporter
+
+    path = tmp_path / "m.prom"
+    payload = {"rounds": True, "metrics": {"latency": {"A": 0.25, "B": True}}}
+    PrometheusExporter.write_metrics(path, "MasterAgent", 0.5, payload)
+    text = path.read_text(encoding="utf-8")
+    assert "True" not in text
+    assert "ftsystem_rounds_total{" not in text
+    assert 'ftsystem_subagent_latency_seconds{agent="MasterAgent",subagent="A"} 0.25' in text
+
+
+def test_metrics_skip_families_whose_samples_are_all_filtered(tmp_path):
+    from core.metrics import PrometheusExporter
+
+    path = tmp_path / "m.prom"
+    payload = {"metrics": {"latency": {"A": True, "B": "fast"}, "success": {"A": False}}}
+    PrometheusExporter.write_metrics(path, "MasterAgent", 0.5, payload)
+    text = path.read_text(encoding="utf-8")
+    assert "ftsystem_subagent_latency_seconds" not in text
+    assert "ftsystem_subagent_success_total" not in text
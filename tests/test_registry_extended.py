@@ -8,7 +8,7 @@ def test_registry_discovers_subpackages(tmp_path):
     # Prepare a temporary subpackage under src/agents
     project_root = Path(__file__).parent.parent
     agents_dir = project_root / "src" / "agents"
-    pkg_dir = agents_dir / "tmp_pkg"
+    pkg_dir = agents_dir / "tmp_agents"
     (pkg_dir / "__init__.py").parent.mkdir(parents=True, exist_ok=True)
     (pkg_dir / "__init__.py").write_text("", encoding="utf-8")
     (pkg_dir / "temp_agent.py").write_text(
@@ -40,14 +40,14 @@ def test_import_errors_are_reported():
     # Create a broken module in agents dir
     project_root = Path(__file__).parent.parent
     agents_dir = project_root / "src" / "agents"
-    broken_file = agents_dir / "tmp_broken_test.py"
+    broken_file = agents_dir / "tmp_broken_agent.py"
     broken_file.write_text("raise ImportError('broken for test')\n", encoding="utf-8")
     try:
         import agents as agents_module
 
         importlib.reload(agents_module)
         # Fully-qualified module name in errors
-        broken_modname = "agents.tmp_broken_test"
+        broken_modname = "agents.tmp_broken_agent"
         assert broken_modname in agents_module.AGENT_IMPORT_ERRORS
         assert "ImportError" in agents_module.AGENT_IMPORT_ERRORS[broken_modname]
     finally:
@@ -57,3 +57,36 @@ def test_import_errors_are_reported():
             pass
         import agents as agents_module
         importlib.reload(agents_module)
+
+
+def test_generated_registry_table_is_current():
+    # scripts/build_agent_registry.py must be re-run when agents are added or moved
+    import agents as agents_module
+    from agents import _registry
+
+    prefix = f"{agents_module.package_name}."
+    modules = tuple(m[len(prefix):] for m in agents_module._agent_module_names())
+    assert _registry.AGENT_MODULES == modules
+    expected = {
+        name: rel for rel in modules for name in agents_module._scan_classes(prefix + rel)
+    }
+    assert _registry.AGENT_INDEX == expected
+
+
+def test_scan_classes_handles_dotted_package_names(monkeypatch):
+    # Imported as ``src.agents`` the prefix has two components; lookups must still
+    # resolve to the module's source file instead of falling back to a full scan
+    import agents as agents_module
+
+    monkeypatch.setattr(agents_module, "package_name", "src.agents")
+    assert agents_module._scan_classes("src.agents.hello_agent") == ["HelloAgent"]
+
+
+def test_slow_agent_has_a_single_definition():
+    # Lazy lookup and full discovery must hand out the same class object
+    import agents as agents_module
+    from agents.slow_agent import SlowAgent
+
+    assert agents_module._class_index()["SlowAgent"] == "agents.slow_agent"
+    assert agents_module.AGENT_REGISTRY["SlowAgent"] is SlowAgent
+    assert dict(agents_module.AGENT_REGISTRY)["SlowAgent"] is SlowAgent
@@ -1,8 +1,8 @@
 """Tests for the Researcher Agent."""
 
 import pytest
-from src.agents.researcher_agent import ResearcherAgent
-from src.agents.base import AgentConfig
+from agents.researcher_agent import ResearcherAgent
+from agents.base import AgentConfig
 
 
 class TestResearcherAgent:
@@ -129,3 +129,15 @@ class TestResearcherAgent:
         result = agent.run(query="Test depth")
         
         assert result["analysis_depth"] == len(result["sources"])
+
+    def test_researcher_batch_matches_single_runs(self):
+        """Test that run_batch returns the same results as individual runs."""
+        config = AgentConfig(name="researcher", description="Test researcher", params={"max_sources": 2})
+        agent = ResearcherAgent(config)
+        
+        queries = ["Machine learning", "Data science"]
+        results = agent.run_batch(queries, context="survey")
+        
+        assert results == [agent.run(query=q, context="survey") for q in queries]
+        with pytest.raises(ValueError, match="Research query is required"):
+            agent.run_batch(["ok", ""])
@@ -21,3 +21,13 @@ def test_session_tags_in_history(tmp_path: Path):
     assert isinstance(arr, list)
     assert all("alpha" in (itm.get("tags") or []) for itm in arr)
 
+
+def test_session_summary_json_bytes_match_model_dump_json():
+    from datetime import datetime, timezone
+
+    from agents.base import SessionSummary
+
+    summary = SessionSummary.from_trusted(
+        timestamp=datetime.now(timezone.utc), agent="HelloAgent", status="ok", data_preview="zażółć", tags=["t"]
+    )
+    assert summary.to_json_bytes() == summary.model_dump_json().encode("utf-8")
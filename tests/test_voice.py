@@ -1,6 +1,16 @@
+import array
+import json
+import logging
+import math
 import os
+import sys
+import threading
+import time
+import types
+
 from typer.testing import CliRunner
 
+from core.voice import STTConfig, VoskSTT
 from main import app
 
 
@@ -25,3 +35,198 @@ def test_interactive_voice_mock(tmp_path):
     assert "Transcribed:" in res.output
     assert "-> Hello, world!" in res.output
 
+
+# Fake vosk/sounddevice modules drive VoskSTT without audio hardware or models.
+# A block is 100ms of a sine tone at the given amplitude (RMS = amplitude / sqrt(2)).
+_LOUD = 5000  # speech
+_QUIET = 50  # background noise
+
+
+def _block(frames: int, amplitude: int) -> bytes:
+    return array.array("h", [int(amplitude * math.sin(i / 5)) for i in range(frames)]).tobytes()
+
+
+class _FakeRecognizer:
+    """Ends a segment after 6 loud blocks in a row, or at the first quiet block after speech."""
+
+    def __init__(self, model, samplerate):
+        self.loud_run = 0
+        self.segments = 0
+        self.accepted = 0
+        _FakeRecognizer.last = self
+
+    def AcceptWaveform(self, data):
+        from core.voice import _rms_int16
+
+        self.accepted += 1
+        if _rms_int16(bytes(data)) > 1000:
+            self.loud_run += 1
+            return self.loud_run == 6
+        return self.loud_run > 0
+
+    def Result(self):
+        self.loud_run = 0
+        self.segments += 1
+        return json.dumps({"text": f"w{self.segments}"})
+
+    def FinalResult(self):
+        return json.dumps({"text": ""})
+
+
+def _install_fakes(monkeypatch, amplitudes, model_cls=None):
+    class Stream:
+        def __init__(self, samplerate, blocksize, device, dtype, channels, callback):
+            self.callback = callback
+            self.blocksize = blocksize
+
+        def __enter__(self):
+            for amp in amplitudes:
+                data = _block(self.blocksize, amp)
+                self.callback(data, self.blocksize, None, None)
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    vosk = types.SimpleNamespace(Model=model_cls or (lambda path: object()), KaldiRecognizer=_FakeRecognizer)
+    monkeypatch.setitem(sys.modules, "vosk", vosk)
+    monkeypatch.setitem(sys.modules, "sounddevice", types.SimpleNamespace(RawInputStream=Stream))
+    return vosk
+
+
+def _listen(tmp_path, **cfg):
+    return VoskSTT(STTConfig(model_dir=tmp_path, beep=False, **cfg)).listen_once()
+
+
+def test_listen_once_stop_on_final_text_is_opt_in(tmp_path, monkeypatch):
+    amplitudes = [_QUIET] * 2 + [_LOUD] * 4 + [_QUIET] * 44
+    _install_fakes(monkeypatch, amplitudes)
+    # Default: keep recording (dictation may continue after a pause) until max_seconds
+    assert _listen(tmp_path, max_seconds=5) == "w1"
+    assert _FakeRecognizer.last.accepted == 50
+    _install_fakes(monkeypatch, amplitudes)
+    # Opt-in: stop 300ms after the segment with text
+    assert _listen(tmp_path, max_seconds=5, stop_on_final_text=True) == "w1"
+    assert _FakeRecognizer.last.accepted == 10
+
+
+def test_listen_once_stops_after_silence(tmp_path, monkeypatch):
+    _install_fakes(monkeypatch, [_QUIET] * 2 + [_LOUD] * 4 + [_QUIET] * 44)
+    text = _listen(tmp_path, max_seconds=5, silence_timeout_sec=0.5)
+    assert text == "w1"
+    # 2 calibration + 4 speech + the quiet block ending the segment + 5 silent blocks
+    assert _FakeRecognizer.last.accepted == 12
+
+
+def test_listen_once_speech_during_calibration_is_not_noise(tmp_path, monkeypatch):
+    # Talking from the first block must not raise the threshold above speech level
+    _install_fakes(monkeypatch, [_LOUD] * 14 + [_QUIET] * 36)
+    text = _listen(tmp_path, max_seconds=5, silence_timeout_sec=0.5)
+    assert text == "w1 w2 w3"
+    assert _FakeRecognizer.last.accepted == 20
+
+
+def test_listen_once_stops_at_max_duration(tmp_path, monkeypatch):
+    _install_fakes(monkeypatch, [_QUIET] * 10)
+    assert _listen(tmp_path, max_seconds=1) == ""
+    assert _FakeRecognizer.last.accepted == 10
+
+
+class _CountingRecognizer:
+    """Reports how many bytes it was fed as its final text."""
+
+    def __init__(self, model, samplerate):
+        self.fed = 0
+
+    def AcceptWaveform(self, data):
+        self.fed += len(data)
+        return False
+
+    def Result(self):
+        return json.dumps({"text": ""})
+
+    def FinalResult(self):
+        return json.dumps({"text": f"n{self.fed}"})
+
+
+class _FakeBatchModel:
+    def __init__(self, path):
+        self.waits = 0
+
+    def Wait(self):
+        self.waits += 1
+
+
+class _FakeBatchRecognizer:
+    def __init__(self, model, samplerate):
+        self.fed = 0
+        self.results: list = []
+
+    def AcceptWaveform(self, data):
+        self.fed += len(data)
+
+    def FinishStream(self):
+        self.results.append(json.dumps({"text": f"b{self.fed}"}))
+
+    def GetPendingChunks(self):
+        return 0
+
+    def Result(self):
+        return self.results.pop(0) if self.results else ""
+
+
+def test_listen_batch_uses_batch_model_and_keeps_order(tmp_path, monkeypatch):
+    vosk = types.SimpleNamespace(
+        Model=lambda path: object(),
+        KaldiRecognizer=_CountingRecognizer,
+        BatchModel=_FakeBatchModel,
+        BatchRecognizer=_FakeBatchRecognizer,
+    )
+    monkeypatch.setitem(sys.modules, "vosk", vosk)
+    stt = VoskSTT(STTConfig(model_dir=tmp_path, beep=False))
+    assert stt.listen_batch([b"\0" * 40000, b"\0" * 100, b""]) == ["b40000", "b100", "b0"]
+    assert stt.listen_batch([]) == []
+
+
+def test_listen_batch_falls_back_to_one_recognizer_per_chunk(tmp_path, monkeypatch):
+    # Builds without BatchModel (CPU-only Vosk) decode each chunk on the regular model
+    vosk = types.SimpleNamespace(Model=lambda path: object(), KaldiRecognizer=_CountingRecognizer)
+    monkeypatch.setitem(sys.modules, "vosk", vosk)
+    stt = VoskSTT(STTConfig(model_dir=tmp_path, beep=False))
+    assert stt.listen_batch([b"\0" * 40000, b"\0" * 100, b""]) == ["n40000", "n100", "n0"]
+
+
+def test_vosk_model_loads_in_background_and_errors_surface(tmp_path, monkeypatch, caplog):
+    release = threading.Event()
+    loaded = []
+
+    def slow_model(path):
+        release.wait(5)
+        loaded.append(path)
+        return object()
+
+    monkeypatch.setitem(sys.modules, "vosk", types.SimpleNamespace(Model=slow_model, KaldiRecognizer=_CountingRecognizer))
+    (tmp_path / "slow").mkdir()
+    start = time.perf_counter()
+    stt = VoskSTT(STTConfig(model_dir=tmp_path / "slow", beep=False))
+    # The constructor returns while the model is still loading
+    assert time.perf_counter() - start < 1.0
+    assert not loaded
+    release.set()
+    assert stt.listen_batch([b"\0" * 10]) == ["n10"]
+    assert loaded == [str(tmp_path / "slow")]
+
+    def broken_model(path):
+        raise OSError("corrupt model")
+
+    monkeypatch.setitem(sys.modules, "vosk", types.SimpleNamespace(Model=broken_model, KaldiRecognizer=_CountingRecognizer))
+    (tmp_path / "broken").mkdir()
+    with caplog.at_level(logging.DEBUG):
+        broken = VoskSTT(STTConfig(model_dir=tmp_path / "broken", beep=False))
+        try:
+            broken.listen_batch([b"\0" * 10])
+        except OSError as e:
+            assert str(e) == "corrupt model"
+        else:
+            raise AssertionError("the preload error was swallowed")
+    assert "Vosk preload failed" in caplog.text
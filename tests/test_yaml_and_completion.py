@@ -38,3 +38,40 @@ def test_agent_autocompletion_function():
     # Should suggest HelloAgent for prefix "he" (case-insensitive)
     suggestions = complete_agent("he")
     assert any(s == "HelloAgent" for s in suggestions)
+
+
+def test_cli_import_defers_agents_and_pydantic():
+    import subprocess
+    import sys
+
+    src = Path(__file__).parent.parent / "src"
+    code = "import sys, main; print('agents' in sys.modules, 'pydantic' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "False"]
+
+
+def test_agent_autocompletion_tracks_registry_changes():
+    from agents import AGENT_REGISTRY
+    from agents.base import Agent
+
+    class ZzCompletionAgent(Agent):
+        def run(self, **kwargs):
+            return None
+
+    assert complete_agent("zzc") == []
+    AGENT_REGISTRY["ZzCompletionAgent"] = ZzCompletionAgent
+    try:
+        assert complete_agent("ZZC") == ["ZzCompletionAgent"]
+    finally:
+        del AGENT_REGISTRY["ZzCompletionAgent"]
+    assert complete_agent("zzc") == []
+    assert complete_agent("") == sorted(AGENT_REGISTRY, key=str.lower)
+
+
+def test_agent_autocompletion_with_plain_dict_registry(monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "_get_registry", lambda: {"beta": object, "Alpha": object, "alps": object})
+    assert complete_agent("AL") == ["Alpha", "alps"]
+    assert complete_agent("b") == ["beta"]
+    assert complete_agent("x") == []